@@ -6,6 +6,11 @@ Tests performance of all modules on Raspberry Pi 5
 
 import sys
 import time
+import shutil
+import argparse
+import resource
+import queue
+import threading
 import cv2
 import numpy as np
 from pathlib import Path
@@ -18,124 +23,389 @@ from facial_recognition import FacialRecognition
 from object_detection import ObjectDetection
 from ocr_module import OCRModule
 from obstacle_detection import ObstacleDetection
+from currency_detection import CurrencyDetection
+
+
+def _bench(fn, iterations, warmup=3):
+    """
+    Time repeated calls of fn
+
+    Args:
+        fn: Zero-argument callable to time
+        iterations: Number of timed calls
+        warmup: Untimed calls made first
+
+    Returns:
+        Array of per-call durations in nanoseconds
+    """
+    for _ in range(warmup):
+        fn()
+
+    times = np.empty(iterations, dtype=np.int64)
+    for i in range(iterations):
+        start = time.perf_counter_ns()
+        fn()
+        times[i] = time.perf_counter_ns() - start
+
+    return times
+
+
+def _latency_stats(times, throughput=True):
+    """
+    Print and collect latency statistics for a timing array
+
+    Args:
+        times: Per-call durations in nanoseconds
+        throughput: Whether to report calls per second
+
+    Returns:
+        Dictionary with avg/min/max/p50/p95/p99 in ms (and fps)
+    """
+    times_ms = times / 1e6
+    p50, p95, p99 = np.percentile(times_ms, [50, 95, 99])
+    stats = {
+        'avg_time_ms': times_ms.mean(),
+        'min_time_ms': times_ms.min(),
+        'max_time_ms': times_ms.max(),
+        'p50_ms': p50,
+        'p95_ms': p95,
+        'p99_ms': p99,
+    }
+
+    print(f"  Iterations: {len(times)}")
+    print(f"  Average time: {stats['avg_time_ms']:.2f}ms")
+    if throughput:
+        stats['fps'] = 1000.0 / stats['avg_time_ms']
+        print(f"  Throughput: {stats['fps']:.2f} FPS")
+    print(f"  Min time: {stats['min_time_ms']:.2f}ms")
+    print(f"  Max time: {stats['max_time_ms']:.2f}ms")
+    print(f"  P50/P95/P99: {p50:.2f}ms / {p95:.2f}ms / {p99:.2f}ms")
+
+    return stats
+
+
+def _timed_initialize(module):
+    """
+    Initialize a module and measure how long loading took
+
+    Returns:
+        Tuple of (success, load_time_ms)
+    """
+    start = time.perf_counter_ns()
+    success = module.initialize()
+    return success, (time.perf_counter_ns() - start) / 1e6
+
+
+def _stage_in_shm(model_path):
+    """
+    Copy a model file to /dev/shm so repeat runs load it from RAM
+
+    TFLite memory-maps model files, so a tmpfs copy skips SD card reads
+    and lets consecutive benchmark runs share the same pages.
+
+    Returns:
+        Path to the staged copy, or the original path if staging failed
+    """
+    shm_dir = Path('/dev/shm')
+    if not shm_dir.is_dir() or not model_path.exists():
+        return model_path
+
+    staged = shm_dir / f"vg_{model_path.name}"
+    try:
+        if not staged.exists() or staged.stat().st_size != model_path.stat().st_size:
+            shutil.copyfile(model_path, staged)
+        return staged
+    except OSError as e:
+        print(f"  Could not stage {model_path.name} in /dev/shm: {e}")
+        return model_path
 
 
 def benchmark_camera(camera, iterations=100):
     """Benchmark camera capture"""
     print("\nBenchmarking Camera Capture...")
 
-    start_time = time.time()
+    times = np.empty(iterations, dtype=np.int64)
     frame_count = 0
 
-    for _ in range(iterations):
+    for i in range(iterations):
+        start = time.perf_counter_ns()
         frame = camera.get_current_frame()
+        times[i] = time.perf_counter_ns() - start
         if frame is not None:
             frame_count += 1
 
-    duration = time.time() - start_time
+    duration = times.sum() / 1e9
     fps = frame_count / duration
+    p50, p95, p99 = np.percentile(times / 1e6, [50, 95, 99])
 
     print(f"  Frames captured: {frame_count}")
     print(f"  Duration: {duration:.2f}s")
     print(f"  Average FPS: {fps:.2f}")
     print(f"  Frame time: {1000/fps:.2f}ms")
+    print(f"  P50/P95/P99: {p50:.2f}ms / {p95:.2f}ms / {p99:.2f}ms")
 
-    return {'fps': fps, 'frame_time_ms': 1000/fps}
+    return {'fps': fps, 'frame_time_ms': 1000/fps, 'p95_ms': p95, 'p99_ms': p99}
 
 
 def benchmark_facial_recognition(face_rec, test_frame, iterations=10):
     """Benchmark facial recognition"""
     print("\nBenchmarking Facial Recognition...")
 
-    times = []
+    times = _bench(lambda: face_rec.recognize_faces(test_frame), iterations)
 
-    for _ in range(iterations):
-        start = time.time()
-        faces = face_rec.recognize_faces(test_frame)
-        elapsed = time.time() - start
-        times.append(elapsed)
-
-    avg_time = sum(times) / len(times)
-    fps = 1.0 / avg_time
-
-    print(f"  Iterations: {iterations}")
-    print(f"  Average time: {avg_time*1000:.2f}ms")
-    print(f"  Throughput: {fps:.2f} FPS")
-    print(f"  Min time: {min(times)*1000:.2f}ms")
-    print(f"  Max time: {max(times)*1000:.2f}ms")
-
-    return {'avg_time_ms': avg_time*1000, 'fps': fps}
+    return _latency_stats(times)
 
 
 def benchmark_object_detection(obj_det, test_frame, iterations=20):
     """Benchmark object detection"""
     print("\nBenchmarking Object Detection...")
 
-    times = []
+    times = _bench(lambda: obj_det.detect_objects(test_frame, force=True), iterations)
 
-    for _ in range(iterations):
-        start = time.time()
-        objects = obj_det.detect_objects(test_frame, force=True)
-        elapsed = time.time() - start
-        times.append(elapsed)
+    return _latency_stats(times)
 
-    avg_time = sum(times) / len(times)
-    fps = 1.0 / avg_time
 
-    print(f"  Iterations: {iterations}")
-    print(f"  Average time: {avg_time*1000:.2f}ms")
-    print(f"  Throughput: {fps:.2f} FPS")
-    print(f"  Min time: {min(times)*1000:.2f}ms")
-    print(f"  Max time: {max(times)*1000:.2f}ms")
+def benchmark_object_detection_batch(obj_det, test_frame, batch_sizes=(1, 2, 4, 8), iterations=32):
+    """Benchmark batched object detection to find the per-frame amortized cost"""
+    print("\nBenchmarking Object Detection (batch sweep)...")
+    print(f"  {'Batch':>5s} {'Calls':>6s} {'Per frame':>11s} {'Per call':>11s} {'P95 call':>11s} {'P99 call':>11s} {'RSS delta':>10s}")
 
-    return {'avg_time_ms': avg_time*1000, 'fps': fps}
+    results = {}
 
+    for batch_size in batch_sizes:
+        frames = [test_frame] * batch_size
+        calls = max(1, iterations // batch_size)
 
-def benchmark_ocr(ocr, test_frame, iterations=10):
-    """Benchmark OCR"""
-    print("\nBenchmarking OCR...")
+        rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        times = _bench(lambda: obj_det.detect_objects_batch(frames), calls, warmup=1)
+        rss_delta_mb = (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss_before) / 1024
+
+        per_call_ms = times.mean() / 1e6
+        per_frame_ms = times.sum() / (calls * batch_size) / 1e6
+        p95_ms, p99_ms = np.percentile(times / 1e6, [95, 99])
+
+        print(f"  {batch_size:5d} {calls:6d} {per_frame_ms:9.2f}ms {per_call_ms:9.2f}ms "
+              f"{p95_ms:9.2f}ms {p99_ms:9.2f}ms {rss_delta_mb:8.1f}MB")
 
-    times = []
+        results[f'batch_{batch_size}_per_frame_ms'] = per_frame_ms
 
-    for _ in range(iterations):
-        start = time.time()
-        result = ocr.read_text(test_frame)
-        elapsed = time.time() - start
-        times.append(elapsed)
+    return results
 
-    avg_time = sum(times) / len(times)
 
-    print(f"  Iterations: {iterations}")
-    print(f"  Average time: {avg_time*1000:.2f}ms")
-    print(f"  Min time: {min(times)*1000:.2f}ms")
-    print(f"  Max time: {max(times)*1000:.2f}ms")
+def benchmark_ocr(ocr, test_frame, iterations=10):
+    """Benchmark OCR"""
+    print("\nBenchmarking OCR...")
 
-    return {'avg_time_ms': avg_time*1000}
+    times = _bench(lambda: ocr.read_text(test_frame), iterations)
+
+    return _latency_stats(times, throughput=False)
 
 
 def benchmark_obstacle_detection(obs_det, test_frame, iterations=20):
     """Benchmark obstacle detection"""
     print("\nBenchmarking Obstacle Detection...")
 
-    times = []
+    times = _bench(lambda: obs_det.detect_obstacles(test_frame), iterations)
+
+    return _latency_stats(times)
+
+
+def benchmark_currency_detection(cur_det, test_frame, iterations=20):
+    """Benchmark currency detection inline and through the background worker"""
+    print("\nBenchmarking Currency Detection...")
+
+    print("  Inline:")
+    stats = _latency_stats(_bench(lambda: cur_det.detect_currency(test_frame), iterations))
+
+    # Submit-to-result latency through the worker thread
+    cur_det.start()
+    latencies = np.empty(iterations, dtype=np.int64)
+    for i in range(iterations):
+        start = time.perf_counter_ns()
+        cur_det.submit(test_frame)
+        cur_det.wait_for_result(timeout=2.0)
+        latencies[i] = time.perf_counter_ns() - start
+    cur_det.stop()
+
+    print("  Submit-to-result (background worker):")
+    submit_stats = _latency_stats(latencies, throughput=False)
+
+    stats['submit_latency_ms'] = submit_stats['avg_time_ms']
+    stats['submit_p95_ms'] = submit_stats['p95_ms']
+    stats['submit_p99_ms'] = submit_stats['p99_ms']
+    return stats
+
+
+# Rough throughput floors (MB/s of input) for a NEON-enabled OpenCV build on
+# a Raspberry Pi 5; anything well below these suggests a generic build.
+PIXEL_OP_MIN_MBPS = {
+    'BGR2GRAY': 400,
+    'BGR2HSV': 150,
+    'BGR2RGB': 600,
+    'resize/2': 400,
+    'GaussianBlur': 150,
+    'Canny': 30,
+    'mean': 1000,
+}
+
 
-    for _ in range(iterations):
-        start = time.time()
-        obstacles = obs_det.detect_obstacles(test_frame)
-        elapsed = time.time() - start
-        times.append(elapsed)
+def benchmark_pixel_ops(frame, iterations=200):
+    """Benchmark core OpenCV pixel primitives to check for SIMD (NEON) acceleration"""
+    print("\nBenchmarking OpenCV Pixel Operations...")
 
-    avg_time = sum(times) / len(times)
-    fps = 1.0 / avg_time
+    neon = cv2.checkHardwareSupport(cv2.CPU_NEON) if hasattr(cv2, 'CPU_NEON') else False
+    print(f"  OpenCV {cv2.__version__}, NEON runtime support: {'yes' if neon else 'no'}")
 
-    print(f"  Iterations: {iterations}")
-    print(f"  Average time: {avg_time*1000:.2f}ms")
-    print(f"  Throughput: {fps:.2f} FPS")
+    gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+    ops = {
+        'BGR2GRAY': (lambda: cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY), frame.nbytes),
+        'BGR2HSV': (lambda: cv2.cvtColor(frame, cv2.COLOR_BGR2HSV), frame.nbytes),
+        'BGR2RGB': (lambda: cv2.cvtColor(frame, cv2.COLOR_BGR2RGB), frame.nbytes),
+        'resize/2': (lambda: cv2.resize(frame, None, fx=0.5, fy=0.5, interpolation=cv2.INTER_AREA), frame.nbytes),
+        'GaussianBlur': (lambda: cv2.GaussianBlur(gray, (5, 5), 0), gray.nbytes),
+        'Canny': (lambda: cv2.Canny(gray, 50, 150), gray.nbytes),
+        'mean': (lambda: cv2.mean(frame), frame.nbytes),
+    }
 
-    return {'avg_time_ms': avg_time*1000, 'fps': fps}
+    results = {}
+    slow_ops = []
+
+    for name, (fn, nbytes) in ops.items():
+        times = _bench(fn, iterations)
+        avg_ms = times.mean() / 1e6
+        p95_ms, p99_ms = np.percentile(times / 1e6, [95, 99])
+        mbps = (nbytes / 1e6) / (avg_ms / 1000)
+
+        flag = ""
+        if mbps < PIXEL_OP_MIN_MBPS[name]:
+            flag = "  <-- SLOW"
+            slow_ops.append(name)
+
+        print(f"  {name:14s}: {avg_ms:7.3f}ms  p95 {p95_ms:7.3f}ms  p99 {p99_ms:7.3f}ms  {mbps:8.1f} MB/s{flag}")
+        results[f'{name}_ms'] = avg_ms
+        results[f'{name}_p95_ms'] = p95_ms
+
+    if slow_ops:
+        print("  Some operations are slower than expected; OpenCV may not be built")
+        print("  with NEON enabled (-DENABLE_NEON=ON).")
+
+    return results
+
+
+def benchmark_pipeline(camera, workers, duration=10.0):
+    """
+    Benchmark capture and detectors running concurrently
+
+    A capture thread fans each new frame out to one bounded queue per
+    worker; each worker runs its detector on the newest frame it can get.
+    Stale frames are dropped rather than queued, as in the live app.
+
+    Args:
+        camera: Started CameraHandler
+        workers: Dict of stage name -> callable taking a frame
+        duration: Seconds to run the pipeline
+
+    Returns:
+        Dictionary with per-stage throughput and latency
+    """
+    print("\nBenchmarking Pipeline (capture + detectors in parallel)...")
+
+    stop_event = threading.Event()
+    stage_queues = {name: queue.Queue(maxsize=2) for name in workers}
+    timings = queue.Queue()
+    captured = [0]
+
+    def capture_loop():
+        seq = 0
+        while not stop_event.is_set():
+            frame = camera.get_frame(timeout=0.5)
+            if frame is None:
+                continue
+
+            item = (seq, time.perf_counter_ns(), frame)
+            for stage_queue in stage_queues.values():
+                # Keep only the newest frames
+                if stage_queue.full():
+                    try:
+                        stage_queue.get_nowait()
+                    except queue.Empty:
+                        pass
+                try:
+                    stage_queue.put_nowait(item)
+                except queue.Full:
+                    pass
+            seq += 1
+        captured[0] = seq
+
+    def worker_loop(name, fn, stage_queue):
+        while not stop_event.is_set():
+            try:
+                seq, captured_at, frame = stage_queue.get(timeout=0.5)
+            except queue.Empty:
+                continue
+
+            start = time.perf_counter_ns()
+            fn(frame)
+            end = time.perf_counter_ns()
+            timings.put((name, seq, end - start, end - captured_at))
+
+    threads = [threading.Thread(target=capture_loop, daemon=True)]
+    for name, fn in workers.items():
+        threads.append(threading.Thread(
+            target=worker_loop, args=(name, fn, stage_queues[name]), daemon=True
+        ))
+
+    start_time = time.perf_counter_ns()
+    for thread in threads:
+        thread.start()
+
+    time.sleep(duration)
+    stop_event.set()
+
+    for thread in threads:
+        thread.join(timeout=5)
+    elapsed = (time.perf_counter_ns() - start_time) / 1e9
+
+    # Group timings by stage
+    per_stage = {name: ([], []) for name in workers}
+    while not timings.empty():
+        name, _, run_ns, e2e_ns = timings.get_nowait()
+        per_stage[name][0].append(run_ns)
+        per_stage[name][1].append(e2e_ns)
+
+    results = {'capture_fps': captured[0] / elapsed}
+    print(f"  Duration: {elapsed:.2f}s")
+    print(f"  Frames captured: {captured[0]} ({results['capture_fps']:.2f} FPS)")
+
+    for name, (run_ns, e2e_ns) in per_stage.items():
+        if not run_ns:
+            print(f"  {name}: no frames processed")
+            continue
+
+        run_ns = np.asarray(run_ns, dtype=np.int64)
+        e2e_ns = np.asarray(e2e_ns, dtype=np.int64)
+        fps = len(run_ns) / elapsed
+
+        e2e_p95, e2e_p99 = np.percentile(e2e_ns / 1e6, [95, 99])
+
+        print(f"  {name}: {len(run_ns)} frames, {fps:.2f} FPS, "
+              f"stage {run_ns.mean()/1e6:.2f}ms, end-to-end {e2e_ns.mean()/1e6:.2f}ms "
+              f"(p95 {e2e_p95:.2f}ms, p99 {e2e_p99:.2f}ms)")
+
+        results[f'{name}_fps'] = fps
+        results[f'{name}_latency_ms'] = e2e_ns.mean() / 1e6
+        results[f'{name}_p95_ms'] = e2e_p95
+        results[f'{name}_p99_ms'] = e2e_p99
+
+    return results
 
 
 def main():
+    parser = argparse.ArgumentParser(description="VisionGuardian performance benchmark")
+    parser.add_argument('--warm-cache', action='store_true',
+                        help="Stage model files in /dev/shm so repeat runs skip disk loads")
+    args = parser.parse_args()
+
     print("=" * 70)
     print("VisionGuardian Performance Benchmark")
     print("Optimized for Raspberry Pi 5 (64-bit ARM64)")
@@ -183,31 +453,77 @@ def main():
     # Camera benchmark
     results['camera'] = benchmark_camera(camera)
 
-    # Facial recognition
+    # OpenCV primitives
+    results['pixel_ops'] = benchmark_pixel_ops(test_frame)
+
+    # Load all models once up front; the same instances serve every benchmark mode
+    print("\nLoading models...")
+
     face_rec = FacialRecognition(config)
-    if face_rec.initialize():
+    face_ok, face_load_ms = _timed_initialize(face_rec)
+
+    obj_det = ObjectDetection(config)
+    if args.warm_cache and getattr(obj_det, 'model_path', None):
+        obj_det.model_path = _stage_in_shm(obj_det.model_path)
+    obj_ok, obj_load_ms = _timed_initialize(obj_det)
+
+    ocr = OCRModule(config)
+    # The same frame is read every iteration; disable the result cache so
+    # the numbers measure OCR, not a perceptual-hash lookup
+    ocr.result_cache.capacity = 0
+    ocr_ok, ocr_load_ms = _timed_initialize(ocr)
+
+    obs_det = ObstacleDetection(config)
+    obs_ok, obs_load_ms = _timed_initialize(obs_det)
+
+    cur_det = CurrencyDetection(config)
+    cur_ok, cur_load_ms = _timed_initialize(cur_det)
+
+    # Facial recognition
+    if face_ok:
         results['facial_recognition'] = benchmark_facial_recognition(face_rec, test_frame)
+        results['facial_recognition']['model_load_ms'] = face_load_ms
     else:
         print("\nFacial recognition not available")
 
     # Object detection
-    obj_det = ObjectDetection(config)
-    if obj_det.initialize():
+    if obj_ok:
         results['object_detection'] = benchmark_object_detection(obj_det, test_frame)
+        results['object_detection']['model_load_ms'] = obj_load_ms
+        results['object_detection_batch'] = benchmark_object_detection_batch(obj_det, test_frame)
     else:
         print("\nObject detection not available (download model first)")
 
     # OCR
-    ocr = OCRModule(config)
-    if ocr.initialize():
+    if ocr_ok:
         results['ocr'] = benchmark_ocr(ocr, test_frame)
+        results['ocr']['model_load_ms'] = ocr_load_ms
     else:
         print("\nOCR not available")
 
     # Obstacle detection
-    obs_det = ObstacleDetection(config)
-    if obs_det.initialize():
+    if obs_ok:
         results['obstacle_detection'] = benchmark_obstacle_detection(obs_det, test_frame)
+        results['obstacle_detection']['model_load_ms'] = obs_load_ms
+
+    # Currency detection
+    if cur_ok:
+        results['currency_detection'] = benchmark_currency_detection(cur_det, test_frame)
+        results['currency_detection']['model_load_ms'] = cur_load_ms
+
+    # Pipelined run with all available detectors sharing the camera
+    pipeline_workers = {}
+    if 'facial_recognition' in results:
+        pipeline_workers['facial_recognition'] = face_rec.recognize_faces
+    if 'object_detection' in results:
+        pipeline_workers['object_detection'] = lambda f: obj_det.detect_objects(f, force=True)
+    if 'ocr' in results:
+        pipeline_workers['ocr'] = ocr.read_text
+    if 'obstacle_detection' in results:
+        pipeline_workers['obstacle_detection'] = obs_det.detect_obstacles
+
+    if pipeline_workers:
+        results['pipeline'] = benchmark_pipeline(camera, pipeline_workers)
 
     # Cleanup
     camera.release()
@@ -237,35 +553,36 @@ def main():
             status = "NEEDS IMPROVEMENT"
         print(f"\nCamera FPS: {fps:.1f} - {status}")
 
+    # Tiers are gated on p95 latency: tail latency is what the user notices
     if 'object_detection' in results:
-        fps = results['object_detection']['fps']
-        if fps >= 10:
+        time_ms = results['object_detection']['p95_ms']
+        if time_ms <= 100:
             status = "EXCELLENT"
-        elif fps >= 5:
+        elif time_ms <= 200:
             status = "GOOD"
         else:
             status = "ACCEPTABLE"
-        print(f"Object Detection: {fps:.1f} FPS - {status}")
+        print(f"Object Detection: p95 {time_ms:.0f}ms ({1000/time_ms:.1f} FPS) - {status}")
 
     if 'facial_recognition' in results:
-        time_ms = results['facial_recognition']['avg_time_ms']
+        time_ms = results['facial_recognition']['p95_ms']
         if time_ms < 1000:
             status = "EXCELLENT"
         elif time_ms < 2000:
             status = "GOOD"
         else:
             status = "ACCEPTABLE"
-        print(f"Facial Recognition: {time_ms:.0f}ms - {status}")
+        print(f"Facial Recognition: p95 {time_ms:.0f}ms - {status}")
 
     if 'ocr' in results:
-        time_ms = results['ocr']['avg_time_ms']
+        time_ms = results['ocr']['p95_ms']
         if time_ms < 2000:
             status = "EXCELLENT"
         elif time_ms < 4000:
             status = "GOOD"
         else:
             status = "ACCEPTABLE"
-        print(f"OCR: {time_ms:.0f}ms - {status}")
+        print(f"OCR: p95 {time_ms:.0f}ms - {status}")
 
     print("\n" + "=" * 70)
     print("Benchmark completed!")
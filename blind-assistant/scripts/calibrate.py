@@ -6,6 +6,7 @@ Calibrates camera for distance estimation
 
 import sys
 import cv2
+import numpy as np
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
@@ -45,7 +46,8 @@ def calibrate_camera():
     print("  1. Place an object at a known distance (e.g., 100cm)")
     print("  2. Ensure the object is clearly visible in the center of frame")
     print("  3. Press 'c' to capture and measure")
-    print("  4. Press 'q' to quit")
+    print("  4. Press '+'/'-' to tune gamma for your lighting")
+    print("  5. Press 'q' to quit")
     print()
 
     try:
@@ -53,6 +55,9 @@ def calibrate_camera():
             frame = camera.get_current_frame()
 
             if frame is not None:
+                # Draw on a private copy; camera frames are shared read-only
+                frame = frame.copy()
+
                 # Draw center crosshair
                 h, w = frame.shape[:2]
                 cv2.line(frame, (w//2 - 20, h//2), (w//2 + 20, h//2), (0, 255, 0), 2)
@@ -60,6 +65,8 @@ def calibrate_camera():
 
                 cv2.putText(frame, "Press 'c' to calibrate, 'q' to quit",
                            (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
+                cv2.putText(frame, f"Gamma: {camera.gamma:.1f} (+/-)",
+                           (10, 60), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
 
                 cv2.imshow('Calibration', frame)
 
@@ -67,6 +74,10 @@ def calibrate_camera():
 
             if key == ord('q'):
                 break
+            elif key in (ord('+'), ord('=')):
+                camera.set_gamma(round(camera.gamma + 0.1, 1))
+            elif key == ord('-') and camera.gamma > 0.2:
+                camera.set_gamma(round(camera.gamma - 0.1, 1))
             elif key == ord('c'):
                 if frame is not None:
                     print()
@@ -74,15 +85,20 @@ def calibrate_camera():
                     try:
                         actual_distance = float(input())
 
-                        # Detect object width
+                        # Detect object width on a half-size image; the target fills
+                        # much of the frame, so a quarter of the pixels is plenty
                         gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-                        edges = cv2.Canny(gray, 50, 150)
+                        small = cv2.resize(gray, None, fx=0.5, fy=0.5, interpolation=cv2.INTER_AREA)
+                        edges = cv2.Canny(small, 50, 150)
                         contours, _ = cv2.findContours(edges, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
 
                         if contours:
                             # Find largest contour near center
-                            largest_contour = max(contours, key=cv2.contourArea)
+                            areas = np.fromiter((cv2.contourArea(c) for c in contours),
+                                                dtype=np.float32, count=len(contours))
+                            largest_contour = contours[int(areas.argmax())]
                             x, y, width, height = cv2.boundingRect(largest_contour)
+                            width *= 2
 
                             if width > 0:
                                 # Calibrate
@@ -92,8 +108,15 @@ def calibrate_camera():
                                 print(f"Calibration successful!")
                                 print(f"Focal length: {obstacle_det.focal_length:.2f} pixels")
                                 print()
-                                print("Save this focal length to config/settings.yaml")
-                                print("under obstacle_detection settings")
+                                print("Save this focal length? (y/n): ", end='')
+                                if input().strip().lower() == 'y':
+                                    try:
+                                        config.save_overrides({
+                                            'obstacle_detection.focal_length_px': round(obstacle_det.focal_length, 2)
+                                        })
+                                        print("Saved to config/settings.override.json")
+                                    except (OSError, ValueError) as e:
+                                        print(f"Could not save focal length: {e}")
                                 print()
                             else:
                                 print("Could not detect object width")
@@ -104,9 +127,18 @@ def calibrate_camera():
                         print("Invalid distance value")
 
     finally:
+        # Release the camera first so a failed save cannot leave it held
+        gamma = camera.gamma
         camera.release()
         cv2.destroyAllWindows()
 
+        if gamma != config.get('camera.gamma', 1.0):
+            try:
+                config.save_overrides({'camera.gamma': gamma})
+                print(f"Saved camera gamma {gamma:.1f} to config/settings.override.json")
+            except (OSError, ValueError) as e:
+                print(f"Could not save camera gamma {gamma:.1f}: {e}")
+
     return 0
 
 
@@ -4,6 +4,7 @@ Train facial recognition encodings from known faces
 Usage: python3 train_faces.py
 """
 
+import os
 import sys
 from pathlib import Path
 
@@ -34,7 +35,8 @@ def main():
 
     # Check for face directories
     known_faces_dir = DATA_DIR / 'known_faces'
-    person_dirs = [d for d in known_faces_dir.iterdir() if d.is_dir()]
+    with os.scandir(known_faces_dir) as entries:
+        person_dirs = [e for e in entries if e.is_dir(follow_symlinks=False)]
 
     if not person_dirs:
         print("No person directories found!")
@@ -47,7 +49,9 @@ def main():
 
     print(f"Found {len(person_dirs)} person directories:")
     for person_dir in person_dirs:
-        photo_count = len(list(person_dir.glob('*.jpg')))
+        # Same '*.jpg' set that training reads; one directory read, no stat per file
+        with os.scandir(person_dir.path) as entries:
+            photo_count = sum(1 for e in entries if e.name.endswith('.jpg') and e.is_file())
         print(f"  - {person_dir.name}: {photo_count} photos")
 
     print()
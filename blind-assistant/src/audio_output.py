@@ -4,10 +4,14 @@ Handles text-to-speech and audio announcements with priority system
 Optimized for Raspberry Pi 5
 """
 
+import io
 import logging
+import os
+import tempfile
 import threading
 import time
 import queue
+from collections import OrderedDict
 from typing import Optional, Dict
 from dataclasses import dataclass
 from enum import IntEnum
@@ -15,13 +19,21 @@ import pyttsx3
 
 try:
     from gtts import gTTS
-    import tempfile
-    import os
     GTTS_AVAILABLE = True
 except ImportError:
     GTTS_AVAILABLE = False
 
-from utils import Config
+try:
+    os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+    import pygame
+    PYGAME_AVAILABLE = True
+except ImportError:
+    PYGAME_AVAILABLE = False
+
+from utils import Config, set_thread_scheduling
+
+# Only short phrases (alerts, greetings, colors) are worth keeping rendered
+MAX_CACHED_SPEECH_LENGTH = 80
 
 
 class Priority(IntEnum):
@@ -62,11 +74,21 @@ class AudioOutput:
         self.language = config.get('audio.language', 'en')
         self.enable_audio_cues = config.get('audio.enable_audio_cues', True)
         self.priority_interrupt = config.get('audio.priority_interrupt', True)
+        self.thread_nice = config.get('audio.thread_nice', -5)
+        self.mixer_frequency = config.get('audio.mixer_frequency', 22050)
+        self.mixer_buffer = config.get('audio.mixer_buffer', 4096)
 
         # TTS engine
         self.tts_engine = None
         self.engine_lock = threading.Lock()
 
+        # Rendered audio for repeated phrases (text -> WAV/MP3 bytes), played
+        # through pygame instead of synthesizing again; LRU order
+        self.speech_cache_size = config.get('audio.speech_cache_size', 64)
+        self._speech_cache = OrderedDict()
+        self._channel = None
+        self._mixer_ready = False
+
         # Announcement queue
         self.announcement_queue = queue.PriorityQueue()
         self.is_speaking = False
@@ -118,6 +140,17 @@ class AudioOutput:
                 self.logger.error(f"Unknown engine type: {self.engine_type}")
                 return False
 
+            # Open the mixer once; re-opening it per phrase costs startup time
+            # and causes underruns/pops on the Pi. TTS output is mono speech,
+            # so 22 kHz with a large buffer is plenty.
+            if PYGAME_AVAILABLE and (self.engine_type == 'gtts' or self.speech_cache_size > 0):
+                try:
+                    pygame.mixer.init(frequency=self.mixer_frequency, size=-16,
+                                      channels=1, buffer=self.mixer_buffer)
+                    self._mixer_ready = True
+                except Exception as e:
+                    self.logger.warning(f"Could not open audio mixer: {e}")
+
             # Start speaker thread
             self.is_running = True
             self.speaker_thread = threading.Thread(target=self._speaker_loop, daemon=True)
@@ -173,6 +206,10 @@ class AudioOutput:
 
     def _speaker_loop(self):
         """Main speaker loop running in background thread"""
+        # Raise speech above background detector work so alerts aren't delayed
+        if not set_thread_scheduling(nice=self.thread_nice):
+            self.logger.debug(f"Could not set speaker thread nice to {self.thread_nice}")
+
         while self.is_running:
             try:
                 # Get next announcement (with timeout)
@@ -209,6 +246,24 @@ class AudioOutput:
             True if successful
         """
         try:
+            if (self._mixer_ready and self.speech_cache_size > 0 and
+                    len(text) <= MAX_CACHED_SPEECH_LENGTH):
+                audio = self._speech_cache.get(text)
+                if audio is None:
+                    audio = self._render_speech(text)
+                    if audio:
+                        self._speech_cache[text] = audio
+                        while len(self._speech_cache) > self.speech_cache_size:
+                            self._speech_cache.popitem(last=False)
+                else:
+                    self._speech_cache.move_to_end(text)
+
+                if audio:
+                    if self._play_audio(audio):
+                        return True
+                    # Unplayable (e.g. mixer lacks MP3 support): speak directly
+                    self._speech_cache.pop(text, None)
+
             if self.engine_type == 'pyttsx3':
                 return self._speak_pyttsx3(text)
             elif self.engine_type == 'gtts':
@@ -221,6 +276,60 @@ class AudioOutput:
             self.logger.error(f"Error speaking: {e}")
             return False
 
+    def _render_speech(self, text: str) -> Optional[bytes]:
+        """
+        Synthesize text to an in-memory audio file without playing it
+
+        Args:
+            text: Text to synthesize
+
+        Returns:
+            WAV (pyttsx3) or MP3 (gTTS) bytes, or None on failure
+        """
+        try:
+            if self.engine_type == 'gtts':
+                buffer = io.BytesIO()
+                gTTS(text=text, lang=self.language, slow=False).write_to_fp(buffer)
+                return buffer.getvalue()
+
+            # pyttsx3 can only render to a file
+            fd, temp_file = tempfile.mkstemp(suffix='.wav')
+            os.close(fd)
+            try:
+                with self.engine_lock:
+                    self.tts_engine.save_to_file(text, temp_file)
+                    self.tts_engine.runAndWait()
+                with open(temp_file, 'rb') as f:
+                    return f.read()
+            finally:
+                os.unlink(temp_file)
+
+        except Exception as e:
+            self.logger.warning(f"Could not render speech for caching: {e}")
+            return None
+
+    def _play_audio(self, audio: bytes) -> bool:
+        """
+        Play rendered audio and block until it finishes or is stopped
+
+        Args:
+            audio: WAV or MP3 file contents
+
+        Returns:
+            True if played
+        """
+        try:
+            self._channel = pygame.mixer.Sound(file=io.BytesIO(audio)).play()
+            while self._channel is not None and self._channel.get_busy():
+                time.sleep(0.05)
+            return True
+
+        except Exception as e:
+            self.logger.debug(f"Cached audio playback failed: {e}")
+            return False
+        finally:
+            self._channel = None
+
     def _speak_pyttsx3(self, text: str) -> bool:
         """Speak using pyttsx3"""
         try:
@@ -236,28 +345,18 @@ class AudioOutput:
         """Speak using gTTS"""
         try:
             # Generate speech
-            tts = gTTS(text=text, lang=self.language, slow=False)
+            buffer = io.BytesIO()
+            gTTS(text=text, lang=self.language, slow=False).write_to_fp(buffer)
+
+            if self._mixer_ready and self._play_audio(buffer.getvalue()):
+                return True
 
-            # Save to temporary file
+            # No usable mixer: play from a temporary file with an external player
             with tempfile.NamedTemporaryFile(delete=False, suffix='.mp3') as fp:
                 temp_file = fp.name
-                tts.save(temp_file)
+                fp.write(buffer.getvalue())
 
-            # Play audio (requires external player like mpg123 or pygame)
-            # For Raspberry Pi, we'll use pygame or system command
-            try:
-                import pygame
-                pygame.mixer.init()
-                pygame.mixer.music.load(temp_file)
-                pygame.mixer.music.play()
-
-                while pygame.mixer.music.get_busy():
-                    time.sleep(0.1)
-
-                pygame.mixer.music.unload()
-            except ImportError:
-                # Fallback to system command
-                os.system(f'mpg123 -q {temp_file}')
+            os.system(f'mpg123 -q {temp_file}')
 
             # Clean up
             os.unlink(temp_file)
@@ -270,7 +369,10 @@ class AudioOutput:
     def _stop_current_speech(self):
         """Stop current speech"""
         try:
-            if self.engine_type == 'pyttsx3':
+            channel = self._channel
+            if channel is not None:
+                channel.stop()
+            elif self.engine_type == 'pyttsx3':
                 with self.engine_lock:
                     self.tts_engine.stop()
             self.is_speaking = False
@@ -390,6 +492,10 @@ class AudioOutput:
             except:
                 pass
 
+        if self._mixer_ready:
+            pygame.mixer.quit()
+            self._mixer_ready = False
+
         self.logger.info("Audio output shutdown")
 
     def __enter__(self):
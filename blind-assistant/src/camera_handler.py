@@ -12,7 +12,7 @@ import time
 from queue import Queue, Empty
 from typing import Optional, Tuple, Callable
 
-from utils import Config, PerformanceMonitor
+from utils import Config, PerformanceMonitor, SharedFrameRing
 
 
 class CameraHandler:
@@ -31,6 +31,11 @@ class CameraHandler:
         self.flip_horizontal = config.get('camera.flip_horizontal', False)
         self.flip_vertical = config.get('camera.flip_vertical', False)
 
+        # Gamma correction as a 256-entry lookup table (None = gamma 1.0, no-op)
+        self.gamma = 1.0
+        self._gamma_lut = None
+        self.set_gamma(config.get('camera.gamma', 1.0))
+
         # Camera object
         self.camera = None
         self.is_running = False
@@ -44,6 +49,16 @@ class CameraHandler:
         self.frame_lock = threading.Lock()
         self.frame_count = 0
 
+        # New-frame notification (shares frame_lock); sequence increases per frame
+        self._frame_cv = threading.Condition(self.frame_lock)
+        self._frame_seq = 0
+
+        # Optional shared memory ring for detectors in other processes (0 = off);
+        # created on the first frame, once the processed frame shape is known
+        self.shared_memory_slots = config.get('camera.shared_memory_slots', 0)
+        self.shared_ring = None
+        self._shared_frame_info = None
+
         # Performance monitoring
         self.performance = PerformanceMonitor()
         self.fps = 0
@@ -59,27 +74,45 @@ class CameraHandler:
         try:
             self.logger.info(f"Initializing camera {self.device_id}...")
 
+            # Integer capture properties, applied by the backend while opening
+            # so the V4L2 stream is configured once instead of per property
+            open_params = [
+                cv2.CAP_PROP_FRAME_WIDTH, self.resolution_width,
+                cv2.CAP_PROP_FRAME_HEIGHT, self.resolution_height,
+                cv2.CAP_PROP_FPS, self.target_fps,
+            ]
+
+            # Enable auto settings
+            if self.config.get('camera.auto_focus', True):
+                open_params += [cv2.CAP_PROP_AUTOFOCUS, 1]
+
             # Try different backends for Raspberry Pi
             backends = [cv2.CAP_V4L2, cv2.CAP_ANY]
+            applied_at_open = True
 
             for backend in backends:
-                self.camera = cv2.VideoCapture(self.device_id, backend)
+                self.camera = cv2.VideoCapture(self.device_id, backend, open_params)
                 if self.camera.isOpened():
                     self.logger.info(f"Camera opened with backend: {backend}")
                     break
 
+            if not self.camera or not self.camera.isOpened():
+                # Some backends reject open-time parameters; open plain and set them one by one
+                applied_at_open = False
+                for backend in backends:
+                    self.camera = cv2.VideoCapture(self.device_id, backend)
+                    if self.camera.isOpened():
+                        self.logger.info(f"Camera opened with backend: {backend}")
+                        break
+
             if not self.camera or not self.camera.isOpened():
                 self.logger.error("Failed to open camera")
                 return False
 
             # Set camera properties
-            self.camera.set(cv2.CAP_PROP_FRAME_WIDTH, self.resolution_width)
-            self.camera.set(cv2.CAP_PROP_FRAME_HEIGHT, self.resolution_height)
-            self.camera.set(cv2.CAP_PROP_FPS, self.target_fps)
-
-            # Enable auto settings
-            if self.config.get('camera.auto_focus', True):
-                self.camera.set(cv2.CAP_PROP_AUTOFOCUS, 1)
+            if not applied_at_open:
+                for prop, value in zip(open_params[::2], open_params[1::2]):
+                    self.camera.set(prop, value)
 
             # Set brightness and contrast
             brightness = self.config.get('camera.brightness', 50)
@@ -94,9 +127,30 @@ class CameraHandler:
 
             self.logger.info(f"Camera initialized: {actual_width}x{actual_height} @ {actual_fps} FPS")
 
-            # Warm up camera
+            # Warm up camera until auto-exposure settles: read() already blocks
+            # for a frame period, so stop after 3 consecutive near-identical
+            # live frames rather than always draining a fixed count
+            frame = None
+            previous = None
+            stable = 0
             for _ in range(10):
-                self.camera.read()
+                ret, frame = self.camera.read()
+                if not ret:
+                    continue
+
+                sample = np.ascontiguousarray(frame[::8, ::8])
+                if (previous is not None and not self._is_uniform(frame)
+                        and cv2.absdiff(sample, previous).mean() < 2.0):
+                    stable += 1
+                    if stable >= 3:
+                        break
+                else:
+                    stable = 0
+                previous = sample
+
+            # Some UVC cameras open fine but only ever deliver a flat grey/black image
+            if frame is None or self._is_uniform(frame):
+                self.logger.warning("Camera is returning blank frames; check device_id and lighting")
 
             self.logger.info("Camera ready")
             return True
@@ -131,6 +185,10 @@ class CameraHandler:
         """Stop frame capture"""
         self.is_running = False
 
+        # Release consumers blocked in get_next_frame()
+        with self._frame_cv:
+            self._frame_cv.notify_all()
+
         if self.capture_thread:
             self.capture_thread.join(timeout=2)
             self.capture_thread = None
@@ -164,10 +222,20 @@ class CameraHandler:
                 # Process frame
                 frame = self._process_frame(frame)
 
-                # Update current frame
-                with self.frame_lock:
+                # Frames are shared with every consumer without copying, so
+                # publish them read-only; each capture gets a fresh array
+                frame.flags.writeable = False
+
+                # Publish to other processes (one copy into shared memory)
+                shared_info = self._publish_shared(frame) if self.shared_memory_slots else None
+
+                # Update current frame and wake consumers waiting for it
+                with self._frame_cv:
                     self.current_frame = frame
+                    self._shared_frame_info = shared_info
                     self.frame_count += 1
+                    self._frame_seq += 1
+                    self._frame_cv.notify_all()
 
                 # Update queue (non-blocking)
                 try:
@@ -191,6 +259,62 @@ class CameraHandler:
                 self.logger.error(f"Error in capture loop: {e}")
                 time.sleep(0.1)
 
+    def _publish_shared(self, frame: np.ndarray) -> Optional[Tuple[str, int, int]]:
+        """
+        Copy frame into the shared memory ring
+
+        Args:
+            frame: Processed frame
+
+        Returns:
+            Tuple of (shared memory name, sequence, slot), or None on failure
+        """
+        try:
+            if self.shared_ring is None or self.shared_ring.shape != frame.shape:
+                if self.shared_ring is not None:
+                    self.shared_ring.close()
+                self.shared_ring = SharedFrameRing(frame.shape, self.shared_memory_slots)
+                self.logger.info(f"Shared frame ring created: {self.shared_ring.name}")
+
+            sequence, slot = self.shared_ring.write(frame)
+            return (self.shared_ring.name, sequence, slot)
+
+        except Exception as e:
+            self.logger.error(f"Error publishing shared frame: {e}")
+            self.shared_memory_slots = 0
+            return None
+
+    def get_shared_frame_info(self) -> Optional[Tuple[str, int, int]]:
+        """
+        Get the location of the latest frame in shared memory
+
+        Another process attaches with SharedFrameRing(shape, slots, name=name)
+        and reads the frame with read(slot, sequence).
+
+        Returns:
+            Tuple of (shared memory name, sequence, slot), or None if disabled
+        """
+        with self.frame_lock:
+            return self._shared_frame_info
+
+    @staticmethod
+    def _is_uniform(frame: np.ndarray) -> bool:
+        """
+        Check whether a frame is a single flat value (dead or uninitialised sensor)
+
+        Judged on a 1/8 subsample in one min/max pass; a live image is
+        never flat across the whole grid.
+
+        Args:
+            frame: Frame to check
+
+        Returns:
+            True if every sampled value is the same
+        """
+        sample = np.ascontiguousarray(frame[::8, ::8]).reshape(-1, 1)
+        lo, hi, _, _ = cv2.minMaxLoc(sample)
+        return lo == hi
+
     def _process_frame(self, frame: np.ndarray) -> np.ndarray:
         """
         Process frame (rotation, flipping, etc.)
@@ -217,6 +341,11 @@ class CameraHandler:
         elif self.flip_vertical:
             frame = cv2.flip(frame, 0)
 
+        # Apply gamma
+        lut = self._gamma_lut
+        if lut is not None:
+            frame = cv2.LUT(frame, lut)
+
         return frame
 
     def get_frame(self, timeout: float = 0.5) -> Optional[np.ndarray]:
@@ -238,13 +367,35 @@ class CameraHandler:
         """
         Get current frame (no waiting)
 
+        The returned frame is shared and read-only; copy it before drawing on it.
+
         Returns:
             Current frame or None
         """
         with self.frame_lock:
-            if self.current_frame is not None:
-                return self.current_frame.copy()
-        return None
+            return self.current_frame
+
+    def get_next_frame(self, last_seq: int = 0,
+                       timeout: float = 0.5) -> Tuple[Optional[np.ndarray], int]:
+        """
+        Wait for a frame newer than last_seq
+
+        The returned frame is shared and read-only; copy it before drawing on it.
+
+        Args:
+            last_seq: Sequence number of the last frame the caller processed
+            timeout: Timeout in seconds
+
+        Returns:
+            Tuple of (frame, sequence number); frame is None on timeout
+        """
+        with self._frame_cv:
+            if not self._frame_cv.wait_for(
+                lambda: self._frame_seq > last_seq or not self.is_running, timeout
+            ) or self.current_frame is None or self._frame_seq <= last_seq:
+                return None, last_seq
+
+            return self.current_frame, self._frame_seq
 
     def read_frame(self) -> Tuple[bool, Optional[np.ndarray]]:
         """
@@ -294,6 +445,27 @@ class CameraHandler:
         if self.camera:
             self.camera.set(cv2.CAP_PROP_CONTRAST, value / 100.0)
 
+    def set_gamma(self, value: float):
+        """
+        Set gamma correction applied to captured frames
+
+        The curve is baked into a lookup table here, so each frame costs a
+        single cv2.LUT pass instead of a per-pixel power.
+
+        Args:
+            value: Gamma (> 1 brightens shadows, 1.0 disables)
+        """
+        if value <= 0:
+            self.logger.warning(f"Ignoring invalid gamma: {value}")
+            return
+
+        self.gamma = value
+        if value == 1.0:
+            self._gamma_lut = None
+        else:
+            levels = np.arange(256, dtype=np.float64) / 255.0
+            self._gamma_lut = np.clip(levels ** (1.0 / value) * 255.0 + 0.5, 0, 255).astype(np.uint8)
+
     def get_performance_stats(self) -> dict:
         """Get performance statistics"""
         stats = self.performance.get_stats('frame_capture')
@@ -310,6 +482,10 @@ class CameraHandler:
             self.camera = None
             self.logger.info("Camera released")
 
+        if self.shared_ring:
+            self.shared_ring.close()
+            self.shared_ring = None
+
     def __enter__(self):
         """Context manager entry"""
         self.initialize()
@@ -338,6 +514,8 @@ def test_camera():
             frame = camera.get_current_frame()
 
             if frame is not None:
+                frame = frame.copy()
+
                 # Display FPS
                 fps = camera.get_fps()
                 cv2.putText(frame, f"FPS: {fps:.1f}", (10, 30),
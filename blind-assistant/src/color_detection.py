@@ -7,15 +7,71 @@ Optimized for Raspberry Pi 5
 import cv2
 import numpy as np
 import logging
-from typing import List, Tuple, Dict
+from typing import List, Tuple
 import webcolors
 
-from utils import Config
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    logging.debug("numba not available, using numpy color lookup")
+
+from utils import Config, CACHE_DIR
+
+
+PALETTE_CACHE_FILE = CACHE_DIR / 'css3_palette.npz'
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def _classify_pixels(pixels, palette):
+        """
+        Brightness-filter and palette-classify packed BGR pixels in one pass
+
+        Returns the nearest palette index per pixel, or -1 for dark pixels
+        (channel sum <= 90, i.e. mean <= 30).
+        """
+        n = pixels.shape[0] // 3
+        out = np.empty(n, dtype=np.int32)
+        for i in prange(n):
+            b = np.int32(pixels[3 * i])
+            g = np.int32(pixels[3 * i + 1])
+            r = np.int32(pixels[3 * i + 2])
+            if b + g + r <= 90:
+                out[i] = -1
+                continue
+            best = 0
+            best_distance = 1 << 30
+            for j in range(palette.shape[0]):
+                d0 = palette[j, 0] - b
+                d1 = palette[j, 1] - g
+                d2 = palette[j, 2] - r
+                distance = d0 * d0 + d1 * d1 + d2 * d2
+                if distance < best_distance:
+                    best_distance = distance
+                    best = j
+            out[i] = best
+        return out
 
 
 class ColorDetection:
     """Detects dominant colors in image regions"""
 
+    # Replace common CSS color names with more natural language
+    _REPLACEMENTS = {
+        'darkblue': 'dark blue',
+        'lightblue': 'light blue',
+        'darkgreen': 'dark green',
+        'lightgreen': 'light green',
+        'darkred': 'dark red',
+        'lightcoral': 'light red',
+        'darkgray': 'dark gray',
+        'lightgray': 'light gray',
+        'darkorange': 'dark orange',
+    }
+    _UNDERSCORE_TO_SPACE = str.maketrans('_', ' ')
+
     def __init__(self, config: Config):
         self.config = config
         self.logger = logging.getLogger('VisionGuardian.ColorDetection')
@@ -25,9 +81,58 @@ class ColorDetection:
         self.num_colors = config.get('color_detection.num_colors', 3)
         self.announce_shade = config.get('color_detection.announce_shade', True)
 
+        # CSS3 color lookup table (built once, reused for every query)
+        self._css3_names, self._css3_rgb = self._load_palette()
+        # Same table in BGR order, matching OpenCV frames
+        self._css3_bgr = np.ascontiguousarray(self._css3_rgb[:, ::-1])
+
+    def _load_palette(self) -> Tuple[List[str], np.ndarray]:
+        """
+        Load the CSS3 palette from the on-disk cache, building it on first use
+
+        Returns:
+            Tuple of (color names, (N, 3) int32 RGB table)
+        """
+        try:
+            with np.load(PALETTE_CACHE_FILE) as data:
+                names = [str(name) for name in data['names']]
+                rgb = data['rgb'].astype(np.int32)
+            if rgb.shape == (len(names), 3) and names:
+                return names, rgb
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            self.logger.warning(f"Ignoring unreadable palette cache: {e}")
+
+        names = list(webcolors.names('css3'))
+        rgb = np.array([webcolors.name_to_rgb(name) for name in names], dtype=np.int32)
+
+        try:
+            np.savez(PALETTE_CACHE_FILE, names=np.array(names), rgb=rgb.astype(np.uint8))
+            self.logger.debug(f"Saved palette cache to {PALETTE_CACHE_FILE}")
+        except Exception as e:
+            self.logger.warning(f"Could not save palette cache: {e}")
+
+        return names, rgb
+
+    def warmup(self):
+        """
+        Compile (or load from cache) the Numba kernel ahead of first use,
+        so the first voice command does not pay the JIT cost
+        """
+        if not NUMBA_AVAILABLE:
+            return
+
+        try:
+            dummy = np.full((8, 8, 3), 128, dtype=np.uint8)
+            _classify_pixels(dummy.reshape(-1), self._css3_bgr)
+            self.logger.info("Color detection kernel compiled")
+        except Exception as e:
+            self.logger.warning(f"Could not warm up color kernel: {e}")
+
     def get_dominant_color(self, image: np.ndarray, k: int = 3) -> List[Tuple[str, float]]:
         """
-        Get dominant colors using K-means clustering
+        Get dominant colors by snapping pixels to the nearest CSS3 color
 
         Args:
             image: Input image region
@@ -40,99 +145,48 @@ class ColorDetection:
             return []
 
         try:
-            # Reshape image to be a list of pixels
-            pixels = image.reshape(-1, 3).astype(np.float32)
-
-            # Remove very dark pixels (likely shadows)
-            brightness = np.mean(pixels, axis=1)
-            pixels = pixels[brightness > 30]
-
-            if len(pixels) == 0:
+            # Shrink large regions to a thumbnail; area averaging keeps color proportions
+            if image.shape[0] * image.shape[1] > 64 * 64:
+                image = cv2.resize(image, (64, 64), interpolation=cv2.INTER_AREA)
+
+            if NUMBA_AVAILABLE:
+                # Fused single pass: dark-pixel filter + nearest palette index
+                indices = _classify_pixels(np.ascontiguousarray(image).reshape(-1), self._css3_bgr)
+                indices = indices[indices >= 0]
+            else:
+                # Reshape image to be a list of pixels (kept as uint8)
+                pixels = image.reshape(-1, 3)
+
+                # Remove very dark pixels (likely shadows): mean > 30 <=> sum > 90
+                pixels = pixels[pixels.sum(axis=1, dtype=np.uint16) > 90].astype(np.int32)
+
+                # Classify each pixel to its nearest palette color
+                distances = np.sum((pixels[:, None, :] - self._css3_bgr[None, :, :]) ** 2, axis=2)
+                indices = np.argmin(distances, axis=1)
+
+            total_pixels = len(indices)
+            if total_pixels == 0:
                 return []
 
-            # Apply K-means clustering
-            criteria = (cv2.TERM_CRITERIA_EPS + cv2.TERM_CRITERIA_MAX_ITER, 100, 0.2)
-            _, labels, centers = cv2.kmeans(pixels, k, None, criteria, 10, cv2.KMEANS_PP_CENTERS)
-
-            # Count pixels in each cluster
-            unique, counts = np.unique(labels, return_counts=True)
-            total_pixels = len(labels)
-
-            # Get color names and percentages
-            colors = []
-            for idx, count in zip(unique, counts):
-                center = centers[idx]
-                percentage = (count / total_pixels) * 100
-
-                # Convert BGR to RGB
-                rgb = tuple(reversed([int(c) for c in center]))
-
-                # Get color name
-                color_name = self._get_color_name(rgb)
-
-                colors.append((color_name, percentage))
+            counts = np.bincount(indices, minlength=len(self._css3_names))
 
-            # Sort by percentage
-            colors.sort(key=lambda x: x[1], reverse=True)
+            # Take the most frequent colors
+            top_n = min(k, self.num_colors, np.count_nonzero(counts))
+            top = np.argpartition(counts, -top_n)[-top_n:]
+            top = top[np.argsort(counts[top])[::-1]]
 
-            return colors[:self.num_colors]
+            return [
+                (self._format_color_name(self._css3_names[idx]), (counts[idx] / total_pixels) * 100)
+                for idx in top
+            ]
 
         except Exception as e:
             self.logger.error(f"Error detecting colors: {e}")
             return []
 
-    def _get_color_name(self, rgb: Tuple[int, int, int]) -> str:
-        """
-        Get closest color name for RGB value
-
-        Args:
-            rgb: RGB tuple
-
-        Returns:
-            Color name
-        """
-        try:
-            # Try to get exact color name
-            color_name = webcolors.rgb_to_name(rgb)
-            return self._format_color_name(color_name)
-        except ValueError:
-            # Find closest color
-            return self._closest_color_name(rgb)
-
-    def _closest_color_name(self, rgb: Tuple[int, int, int]) -> str:
-        """Find closest named color"""
-        min_distance = float('inf')
-        closest_name = 'unknown'
-
-        for name in webcolors.names('css3'):
-            try:
-                name_rgb = webcolors.name_to_rgb(name)
-                distance = sum((a - b) ** 2 for a, b in zip(rgb, name_rgb))
-
-                if distance < min_distance:
-                    min_distance = distance
-                    closest_name = name
-            except:
-                continue
-
-        return self._format_color_name(closest_name)
-
     def _format_color_name(self, name: str) -> str:
         """Format color name for announcement"""
-        # Replace common CSS color names with more natural language
-        replacements = {
-            'darkblue': 'dark blue',
-            'lightblue': 'light blue',
-            'darkgreen': 'dark green',
-            'lightgreen': 'light green',
-            'darkred': 'dark red',
-            'lightcoral': 'light red',
-            'darkgray': 'dark gray',
-            'lightgray': 'light gray',
-            'darkorange': 'dark orange',
-        }
-
-        return replacements.get(name, name.replace('_', ' '))
+        return self._REPLACEMENTS.get(name) or name.translate(self._UNDERSCORE_TO_SPACE)
 
     def detect_color_at_center(self, frame: np.ndarray) -> str:
         """
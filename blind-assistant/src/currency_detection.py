@@ -7,6 +7,8 @@ Optimized for Raspberry Pi 5
 import cv2
 import numpy as np
 import logging
+import queue
+import threading
 from typing import Optional, Dict
 
 from utils import Config, MODELS_DIR
@@ -24,10 +26,18 @@ class CurrencyDetection:
         self.supported_currencies = config.get('currency_detection.supported_currencies', ['USD'])
         self.confidence_threshold = config.get('currency_detection.confidence_threshold', 0.7)
         self.announcement_format = config.get('currency_detection.announcement_format', 'detailed')
+        self.processing_width = config.get('currency_detection.processing_width', 320)
 
         # Currency model (would be loaded here)
         self.model = None
 
+        # Background worker (latest frame wins)
+        self._frame_queue = queue.Queue(maxsize=1)
+        self._worker_thread = None
+        self._is_running = False
+        self._last_result = None
+        self._result_ready = threading.Event()
+
         # US Dollar denominations (color-based heuristics as fallback)
         self.usd_denominations = {
             1: 'one dollar',
@@ -86,6 +96,86 @@ class CurrencyDetection:
             self.logger.error(f"Error detecting currency: {e}")
             return None
 
+    def start(self):
+        """Start background detection thread fed by submit()"""
+        if self._is_running:
+            return
+
+        self._is_running = True
+        self._worker_thread = threading.Thread(target=self._worker_loop, daemon=True)
+        self._worker_thread.start()
+        self.logger.info("Currency detection worker started")
+
+    def stop(self):
+        """Stop background detection thread"""
+        self._is_running = False
+
+        if self._worker_thread:
+            self._worker_thread.join(timeout=2)
+            self._worker_thread = None
+
+    def submit(self, frame: np.ndarray) -> bool:
+        """
+        Queue frame for background detection (non-blocking)
+
+        An older frame still waiting in the queue is dropped so the
+        most recent frame is always the next one processed.
+
+        Args:
+            frame: Input frame
+
+        Returns:
+            True if the frame was queued
+        """
+        if not self.enabled or not self._is_running:
+            return False
+
+        # A result still flagged from an earlier frame must not satisfy
+        # wait_for_result() for this one
+        self._result_ready.clear()
+
+        try:
+            self._frame_queue.get_nowait()
+        except queue.Empty:
+            pass
+
+        try:
+            self._frame_queue.put_nowait(frame)
+            return True
+        except queue.Full:
+            return False
+
+    def get_latest(self) -> Optional[Dict]:
+        """Get the most recent background detection result"""
+        return self._last_result
+
+    def wait_for_result(self, timeout: float = 1.0) -> Optional[Dict]:
+        """
+        Wait for the next background detection to finish
+
+        Args:
+            timeout: Timeout in seconds
+
+        Returns:
+            Latest result, or None on timeout or when no currency was found
+        """
+        if not self._result_ready.wait(timeout):
+            return None
+
+        self._result_ready.clear()
+        return self._last_result
+
+    def _worker_loop(self):
+        """Background detection loop"""
+        while self._is_running:
+            try:
+                frame = self._frame_queue.get(timeout=0.5)
+            except queue.Empty:
+                continue
+
+            self._last_result = self.detect_currency(frame)
+            self._result_ready.set()
+
     def _detect_usd_bill_heuristic(self, frame: np.ndarray) -> Optional[Dict]:
         """
         Heuristic-based USD bill detection (basic implementation)
@@ -96,42 +186,50 @@ class CurrencyDetection:
         Returns:
             Detection result
         """
-        # Convert to HSV
-        hsv = cv2.cvtColor(frame, cv2.COLOR_BGR2HSV)
+        # Run edge search on a downscaled copy; bboxes are scaled back up
+        frame_h, frame_w = frame.shape[:2]
+        scale = min(1.0, self.processing_width / float(frame_w))
+        if scale < 1.0:
+            small = cv2.resize(frame, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+        else:
+            small = frame
 
         # Look for rectangular shapes with appropriate aspect ratio
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        gray = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
         edges = cv2.Canny(gray, 50, 150)
 
-        # Find contours
-        contours, _ = cv2.findContours(edges, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        # Bounding boxes of every edge component in one pass (row 0 is background)
+        _, _, stats, _ = cv2.connectedComponentsWithStats(edges, connectivity=8)
+        stats = stats[1:]
 
-        for contour in contours:
-            area = cv2.contourArea(contour)
+        widths = stats[:, cv2.CC_STAT_WIDTH]
+        heights = stats[:, cv2.CC_STAT_HEIGHT]
 
-            # Filter by area
-            if area < 10000:
-                continue
+        # Edge components are outlines, so filter on bounding-box area
+        min_area = 10000 * scale * scale
+        aspect_ratios = widths / np.maximum(heights, 1).astype(np.float32)
+
+        # US bills have aspect ratio ~2.35:1
+        candidates = (widths * heights >= min_area) & (aspect_ratios > 2.0) & (aspect_ratios < 2.7)
 
-            # Get bounding rectangle
-            x, y, w, h = cv2.boundingRect(contour)
-            aspect_ratio = w / float(h) if h > 0 else 0
+        for x, y, w, h in stats[candidates, :4]:
+            # Map back to full-resolution coordinates
+            x, y = int(x / scale), int(y / scale)
+            w, h = min(int(w / scale), frame_w - x), min(int(h / scale), frame_h - y)
 
-            # US bills have aspect ratio ~2.35:1
-            if 2.0 < aspect_ratio < 2.7:
-                # Extract region
-                bill_region = frame[y:y+h, x:x+w]
+            # Extract region
+            bill_region = frame[y:y+h, x:x+w]
 
-                # Analyze color to estimate denomination (very basic)
-                denomination = self._estimate_denomination_by_color(bill_region)
+            # Analyze color to estimate denomination (very basic)
+            denomination = self._estimate_denomination_by_color(bill_region)
 
-                if denomination:
-                    return {
-                        'amount': denomination,
-                        'currency': 'USD',
-                        'confidence': 0.6,  # Low confidence for heuristic
-                        'bbox': (x, y, x+w, y+h)
-                    }
+            if denomination:
+                return {
+                    'amount': denomination,
+                    'currency': 'USD',
+                    'confidence': 0.6,  # Low confidence for heuristic
+                    'bbox': (x, y, x+w, y+h)
+                }
 
         return None
 
@@ -148,7 +246,8 @@ class CurrencyDetection:
         # This is a placeholder - real implementation would use ML model
         # US bills are primarily green with subtle color differences
 
-        avg_color = np.mean(region, axis=(0, 1))
+        # Per-channel BGR mean in a single pass (alpha channel dropped)
+        avg_color = cv2.mean(region)[:3]
 
         # Very basic heuristic (not accurate, just for demonstration)
         # In production, use trained classifier
@@ -172,12 +172,14 @@ class FacialRecognition:
         except Exception as e:
             self.logger.error(f"Error loading encodings: {e}")
 
-    def recognize_faces(self, frame: np.ndarray) -> List[Dict]:
+    def recognize_faces(self, frame: np.ndarray,
+                        rgb_frame: Optional[np.ndarray] = None) -> List[Dict]:
         """
         Recognize faces in frame
 
         Args:
             frame: Input frame (BGR format)
+            rgb_frame: Optional RGB copy of frame, if already converted
 
         Returns:
             List of recognized faces with info
@@ -189,8 +191,9 @@ class FacialRecognition:
         recognized_faces = []
 
         try:
-            # Convert BGR to RGB
-            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            # Convert BGR to RGB (unless the caller already did)
+            if rgb_frame is None:
+                rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
 
             # Detect face locations
             face_locations = face_recognition.face_locations(
@@ -10,28 +10,62 @@ import logging
 import time
 import threading
 import signal
+import importlib
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
 
 # Add src directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from utils import Config, setup_logging, get_system_info, check_raspberry_pi5
+from utils import (Config, setup_logging, get_system_info, check_raspberry_pi5,
+                   get_opencv_cpu_features, read_cpu_temperature, set_thread_scheduling,
+                   FramePreprocessor, SceneChangeDetector)
 from storage_manager import StorageManager
 from camera_handler import CameraHandler
 from audio_output import AudioOutput, Priority
-from facial_recognition import FacialRecognition
-from object_detection import ObjectDetection
-from ocr_module import OCRModule
-from scene_description import SceneDescription
 from obstacle_detection import ObstacleDetection
-from currency_detection import CurrencyDetection
-from color_detection import ColorDetection
 from voice_assistant import VoiceAssistant
 
+# Signals that request shutdown; blocked in every thread but the main one
+SHUTDOWN_SIGNALS = {signal.SIGINT, signal.SIGTERM}
+
+
+@contextmanager
+def shutdown_signals_blocked():
+    """
+    Block shutdown signals in the calling thread while worker threads are created
+
+    Threads inherit the mask, so the signals are only ever delivered to the
+    main thread. One arriving inside the block stays pending and is handled
+    as soon as the previous mask is restored.
+    """
+    if not hasattr(signal, 'pthread_sigmask'):
+        yield
+        return
+
+    previous = signal.pthread_sigmask(signal.SIG_BLOCK, SHUTDOWN_SIGNALS)
+    try:
+        yield
+    finally:
+        signal.pthread_sigmask(signal.SIG_SETMASK, previous)
+
 
 class VisionGuardian:
     """Main application class"""
 
+    # Modules loaded in the background after startup, imported on first use
+    # (feature flag, attribute, module, class, display name)
+    DEFERRED_MODULES = [
+        ('facial_recognition', 'face_recognition', 'facial_recognition', 'FacialRecognition', 'Facial recognition'),
+        ('object_detection', 'object_detection', 'object_detection', 'ObjectDetection', 'Object detection'),
+        ('ocr', 'ocr', 'ocr_module', 'OCRModule', 'Text reading'),
+        ('scene_description', 'scene_description', 'scene_description', 'SceneDescription', 'Scene description'),
+        ('currency_detection', 'currency_detection', 'currency_detection', 'CurrencyDetection', 'Currency detection'),
+        ('color_detection', 'color_detection', 'color_detection', 'ColorDetection', 'Color detection'),
+    ]
+
     def __init__(self):
         # Load configuration
         self.config = Config()
@@ -64,6 +98,8 @@ class VisionGuardian:
 
         # Application state
         self.is_running = False
+        self._shutdown_event = threading.Event()  # Wakes sleeping threads on shutdown
+        self._shutdown_done = False
         self.active_mode = 'auto'  # auto, obstacle, read, identify, currency, color
         self.last_announcement = ""
 
@@ -72,6 +108,37 @@ class VisionGuardian:
 
         # Processing threads
         self.threads = []
+        self.loader_thread = None
+        self.detector_executor = None
+
+        # Voice commands that run inference execute here so the voice
+        # assistant can keep listening; one in-flight run per command
+        self._cmd_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='cmd')
+        self._inflight = {}  # action -> Future
+
+        # Detector scheduling: base periods (seconds, start-to-start; 0 = every
+        # frame), measured latency EWMA, thermal backoff and obstacle boost
+        self.detector_periods = {
+            'obstacle': self.config.get('performance.detector_periods.obstacle', 0.0),
+            'face': self.config.get('performance.detector_periods.face', 2.0),
+            'object': self.config.get('performance.detector_periods.object', 3.0),
+        }
+        self.detector_latency = {}
+        self.latency_alpha = 0.2
+        self.thermal_scale = 1.0
+        self.thermal_backoff_temp = self.config.get('performance.thermal_backoff_temp_c', 75)
+        self.thermal_backoff_factor = self.config.get('performance.thermal_backoff_factor', 1.25)
+        self.obstacle_boost_seconds = self.config.get('performance.obstacle_boost_seconds', 10)
+        self.obstacle_boost_until = 0.0
+        self.currency_timeout = self.config.get('currency_detection.result_timeout_seconds', 2)
+
+        # Last text announced per detector key, for dropping back-to-back repeats
+        self._last_announce = {}  # key -> (text, timestamp)
+        self.repeat_suppression = self.config.get('audio.repeat_suppression_seconds', 5)
+
+        # Settings read inside background loops
+        self._debug_mode = self.config.get('system.debug_mode', False)
+        self._auto_cleanup = self.config.get('storage.auto_cleanup', True)
 
         # Feature enable flags
         self.features_enabled = {
@@ -97,6 +164,12 @@ class VisionGuardian:
         if not is_rpi5:
             self.logger.warning("Not running on Raspberry Pi 5 - performance may vary")
 
+        # Check OpenCV was built with ARM SIMD enabled
+        cv_features = get_opencv_cpu_features()
+        self.logger.info(f"OpenCV CPU baseline: {cv_features['baseline'] or 'unknown'}")
+        if info['architecture'] == 'aarch64' and 'NEON' not in cv_features['baseline']:
+            self.logger.warning("OpenCV built without NEON baseline - rebuild with -mcpu=cortex-a76 for best performance")
+
         # Check storage
         status, message = self.storage_manager.check_storage_health()
         self.logger.info(f"Storage: {message}")
@@ -121,65 +194,20 @@ class VisionGuardian:
             # Initialize audio
             self.logger.info("Initializing audio output...")
             self.audio = AudioOutput(self.config)
-            if not self.audio.initialize():
+            with shutdown_signals_blocked():
+                audio_ready = self.audio.initialize()
+            if not audio_ready:
                 self.logger.error("Failed to initialize audio")
                 return False
 
             self.audio.announce("VisionGuardian initializing", Priority.HIGH)
 
-            # Initialize facial recognition
-            if self.features_enabled['facial_recognition']:
-                self.logger.info("Initializing facial recognition...")
-                self.face_recognition = FacialRecognition(self.config)
-                if self.face_recognition.initialize():
-                    self.logger.info("Facial recognition ready")
-                else:
-                    self.logger.warning("Facial recognition initialization failed")
-                    self.features_enabled['facial_recognition'] = False
-
-            # Initialize object detection
-            if self.features_enabled['object_detection']:
-                self.logger.info("Initializing object detection...")
-                self.object_detection = ObjectDetection(self.config)
-                if self.object_detection.initialize():
-                    self.logger.info("Object detection ready")
-                else:
-                    self.logger.warning("Object detection initialization failed")
-                    self.features_enabled['object_detection'] = False
-
-            # Initialize OCR
-            if self.features_enabled['ocr']:
-                self.logger.info("Initializing OCR...")
-                self.ocr = OCRModule(self.config)
-                if self.ocr.initialize():
-                    self.logger.info("OCR ready")
-                else:
-                    self.logger.warning("OCR initialization failed")
-                    self.features_enabled['ocr'] = False
-
-            # Initialize scene description
-            if self.features_enabled['scene_description']:
-                self.scene_description = SceneDescription(self.config)
-                if self.scene_description.initialize():
-                    self.logger.info("Scene description ready")
-
-            # Initialize obstacle detection
+            # Initialize obstacle detection (safety-critical, needed from the start)
             if self.features_enabled['obstacle_detection']:
                 self.obstacle_detection = ObstacleDetection(self.config)
                 if self.obstacle_detection.initialize():
                     self.logger.info("Obstacle detection ready")
 
-            # Initialize currency detection
-            if self.features_enabled['currency_detection']:
-                self.currency_detection = CurrencyDetection(self.config)
-                if self.currency_detection.initialize():
-                    self.logger.info("Currency detection ready")
-
-            # Initialize color detection
-            if self.features_enabled['color_detection']:
-                self.color_detection = ColorDetection(self.config)
-                self.logger.info("Color detection ready")
-
             # Initialize voice assistant
             if self.features_enabled['voice_assistant']:
                 self.voice_assistant = VoiceAssistant(self.config)
@@ -187,7 +215,12 @@ class VisionGuardian:
                     self._setup_voice_commands()
                     self.logger.info("Voice assistant ready")
 
-            self.logger.info("All components initialized successfully")
+            # Load the remaining modules without holding up the user
+            self.loader_thread = threading.Thread(target=self._load_deferred_modules, daemon=True)
+            with shutdown_signals_blocked():
+                self.loader_thread.start()
+
+            self.logger.info("Core components initialized")
             self.audio.announce("VisionGuardian ready", Priority.HIGH)
 
             return True
@@ -196,17 +229,63 @@ class VisionGuardian:
             self.logger.error(f"Initialization failed: {e}")
             return False
 
+    def _load_deferred_modules(self):
+        """
+        Background thread that imports and initializes the non-critical modules
+
+        Each module is published on its attribute only once fully initialized,
+        so the scheduler and voice commands treat it as absent until then.
+        """
+        for feature, attribute, module_name, class_name, display_name in self.DEFERRED_MODULES:
+            if not self.features_enabled[feature]:
+                continue
+
+            try:
+                self.logger.info(f"Initializing {display_name.lower()}...")
+                module_class = getattr(importlib.import_module(module_name), class_name)
+                instance = module_class(self.config)
+
+                if hasattr(instance, 'initialize') and not instance.initialize():
+                    self.logger.warning(f"{display_name} initialization failed")
+                    self.features_enabled[feature] = False
+                    continue
+
+                # JIT-compile pixel kernels now rather than on the first command
+                if hasattr(instance, 'warmup'):
+                    instance.warmup()
+
+                # Modules with a background worker (currency detection) start it here
+                if hasattr(instance, 'start'):
+                    instance.start()
+
+                setattr(self, attribute, instance)
+                self.logger.info(f"{display_name} ready")
+
+            except Exception as e:
+                self.logger.error(f"Error initializing {display_name.lower()}: {e}")
+                self.features_enabled[feature] = False
+
+        self.logger.info("All components initialized successfully")
+
     def _setup_voice_commands(self):
         """Setup voice command callbacks"""
         if not self.voice_assistant:
             return
 
-        self.voice_assistant.register_command_callback('read_text', self._cmd_read_text)
-        self.voice_assistant.register_command_callback('describe_scene', self._cmd_describe_scene)
-        self.voice_assistant.register_command_callback('identify_people', self._cmd_identify_people)
-        self.voice_assistant.register_command_callback('detect_color', self._cmd_detect_color)
-        self.voice_assistant.register_command_callback('detect_currency', self._cmd_detect_currency)
-        self.voice_assistant.register_command_callback('check_obstacles', self._cmd_check_obstacles)
+        # Commands that run inference return immediately and finish on the command pool
+        background_commands = {
+            'read_text': self._cmd_read_text,
+            'describe_scene': self._cmd_describe_scene,
+            'identify_people': self._cmd_identify_people,
+            'detect_color': self._cmd_detect_color,
+            'detect_currency': self._cmd_detect_currency,
+            'check_obstacles': self._cmd_check_obstacles,
+        }
+        for action, handler in background_commands.items():
+            self.voice_assistant.register_command_callback(
+                action, self._background_command(action, handler)
+            )
+
         self.voice_assistant.register_command_callback('show_help', self._cmd_show_help)
         self.voice_assistant.register_command_callback('stop_all', self._cmd_stop)
         self.voice_assistant.register_command_callback('repeat_last', self._cmd_repeat)
@@ -216,15 +295,18 @@ class VisionGuardian:
         try:
             self.is_running = True
 
-            # Start camera capture
-            self.camera.start_capture()
+            # Worker threads are created with shutdown signals blocked, so
+            # only the main thread receives them
+            with shutdown_signals_blocked():
+                # Start camera capture
+                self.camera.start_capture()
 
-            # Start processing threads
-            self._start_processing_threads()
+                # Start processing threads
+                self._start_processing_threads()
 
-            # Start voice assistant
-            if self.voice_assistant:
-                self.voice_assistant.start_listening()
+                # Start voice assistant
+                if self.voice_assistant:
+                    self.voice_assistant.start_listening()
 
             self.logger.info("VisionGuardian started successfully")
 
@@ -240,21 +322,24 @@ class VisionGuardian:
 
     def _start_processing_threads(self):
         """Start background processing threads"""
-        # Obstacle detection thread (highest priority)
-        if self.features_enabled['obstacle_detection']:
-            thread = threading.Thread(target=self._obstacle_detection_loop, daemon=True)
-            thread.start()
-            self.threads.append(thread)
-
-        # Facial recognition thread
-        if self.features_enabled['facial_recognition']:
-            thread = threading.Thread(target=self._facial_recognition_loop, daemon=True)
-            thread.start()
-            self.threads.append(thread)
-
-        # Object detection thread
-        if self.features_enabled['object_detection']:
-            thread = threading.Thread(target=self._object_detection_loop, daemon=True)
+        # Single scheduler thread drives all frame-based detectors
+        if (self.features_enabled['obstacle_detection'] or
+                self.features_enabled['facial_recognition'] or
+                self.features_enabled['object_detection']):
+            # Heavy inference runs here; the native code releases the GIL.
+            # Workers stay off the obstacle core, and drop the SCHED_FIFO policy
+            # they inherit from the scheduler thread that spawns them on submit()
+            self.detector_executor = ThreadPoolExecutor(
+                max_workers=2,
+                thread_name_prefix='detector',
+                initializer=partial(
+                    set_thread_scheduling,
+                    cpus=set(self.config.get('performance.detector_cpu_cores', [0, 1, 2])),
+                    normal_policy=True
+                )
+            )
+
+            thread = threading.Thread(target=self._scheduler_loop, daemon=True)
             thread.start()
             self.threads.append(thread)
 
@@ -264,92 +349,243 @@ class VisionGuardian:
         self.threads.append(thread)
 
     def _main_loop(self):
-        """Main processing loop"""
-        frame_count = 0
-
-        while self.is_running:
+        """Main loop: sleeps until shutdown, waking once a second for debug stats"""
+        while not self._shutdown_event.wait(timeout=1.0):
             try:
-                frame = self.camera.get_current_frame()
+                # Display FPS (if debug mode)
+                if self._debug_mode:
+                    self.logger.debug(f"FPS: {self.camera.get_fps():.1f}")
+
+            except Exception as e:
+                self.logger.error(f"Error in main loop: {e}")
 
-                if frame is not None:
-                    frame_count += 1
+    def _scheduler_loop(self):
+        """
+        Background thread that dispatches detectors on their own cadence
+
+        Obstacle detection (highest priority, cheap) runs inline on every
+        new frame. Facial recognition and object detection are offloaded
+        to the detector pool; if a previous run is still in progress the
+        detector skips this frame rather than queueing behind it.
 
-                    # Display FPS (if debug mode)
-                    if self.config.get('system.debug_mode', False):
-                        fps = self.camera.get_fps()
-                        if frame_count % 30 == 0:
-                            self.logger.debug(f"FPS: {fps:.1f}")
+        Periods are measured start-to-start, so a detector's own run time
+        is part of its period rather than added to it.
+        """
+        self.logger.info("Detector scheduler thread started")
+
+        # Obstacle detection runs on this thread: give it a dedicated core and
+        # real-time priority so other detectors and TTS cannot delay alerts
+        if not set_thread_scheduling(
+            cpus=set(self.config.get('performance.obstacle_cpu_cores', [3])),
+            realtime_priority=self.config.get('performance.obstacle_realtime_priority', 20)
+        ):
+            self.logger.warning("Could not apply real-time scheduling to obstacle detection "
+                                "(needs LimitRTPRIO or CAP_SYS_NICE)")
+
+        # (name, module attribute, handler, offload to pool, shared input)
+        detectors = []
+        if self.features_enabled['obstacle_detection']:
+            detectors.append(('obstacle', 'obstacle_detection', self._run_obstacle_detection, False, 'gray'))
+        if self.features_enabled['facial_recognition']:
+            detectors.append(('face', 'face_recognition', self._run_facial_recognition, True, 'rgb'))
+        if self.features_enabled['object_detection']:
+            detectors.append(('object', 'object_detection', self._run_object_detection, True, 'object_input'))
 
-                time.sleep(0.01)  # Small delay to prevent CPU overload
+        # Color conversion / resizing shared by all detectors due on a tick
+        preprocessor = FramePreprocessor()
 
-            except Exception as e:
-                self.logger.error(f"Error in main loop: {e}")
-                time.sleep(0.1)
+        # Face/object detection is skipped while the scene is static, but never
+        # for longer than static_scene_max_skip_seconds
+        scene = SceneChangeDetector(self.config.get('performance.scene_change_threshold', 4.0))
+        max_static_skip = self.config.get('performance.static_scene_max_skip_seconds', 5.0)
+        last_run = {}
 
-    def _obstacle_detection_loop(self):
-        """Background thread for obstacle detection"""
-        self.logger.info("Obstacle detection thread started")
+        start = time.time()
+        next_due = {name: start + self.detector_periods.get(name, 0.0) for name, *_ in detectors}
+        pending = {}
+        last_seq = 0
+        last_thermal_check = 0
 
         while self.is_running:
             try:
-                frame = self.camera.get_current_frame()
+                # Sleep until the earliest detector is due, then take the next fresh frame
+                wait = min(next_due.values()) - time.time()
+                if wait > 0 and self._shutdown_event.wait(wait):
+                    break
+
+                frame, last_seq = self.camera.get_next_frame(last_seq, timeout=0.5)
+                if frame is None:
+                    continue
+
+                now = time.time()
+                if now - last_thermal_check >= 10:
+                    self._update_thermal_scale()
+                    last_thermal_check = now
+
+                # Object detector input size is known once its model has loaded
+                if preprocessor.object_input_size is None and self.object_detection:
+                    preprocessor.object_input_size = self.object_detection.get_input_size()
+
+                # Detectors due now; modules still loading and offloaded ones still
+                # running skip this frame, and all of them yield to an obstacle boost
+                boosted = now < self.obstacle_boost_until
+                thumbnail = None
+                due = []
+                for detector in detectors:
+                    name, attribute, _, offload, _ = detector
+                    if now < next_due[name] or (offload and boosted):
+                        continue
+                    if getattr(self, attribute) is None:
+                        continue
+                    future = pending.get(name)
+                    if offload and future is not None and not future.done():
+                        continue
+
+                    # Obstacle detection always runs (safety); the others only
+                    # when the scene has changed since their last run
+                    if offload:
+                        if thumbnail is None:
+                            thumbnail = scene.thumbnail(frame)
+                        if (not scene.changed(name, thumbnail) and
+                                now - last_run.get(name, 0) < max_static_skip):
+                            next_due[name] = now + self._detector_period(name, now)
+                            continue
+                        scene.mark(name, thumbnail)
+                        last_run[name] = now
+
+                    due.append(detector)
+
+                if not due:
+                    continue
+
+                # Preprocess once for every detector that runs this tick. Buffers are
+                # reused per key, which is safe because a detector never has two
+                # runs in flight.
+                inputs = preprocessor(frame, {key for *_, key in due})
+
+                for name, _, handler, offload, key in due:
+                    if offload:
+                        pending[name] = self.detector_executor.submit(
+                            self._timed_run, name, handler, frame, inputs.get(key)
+                        )
+                    else:
+                        self._timed_run(name, handler, frame, inputs.get(key))
+
+                    next_due[name] = now + self._detector_period(name, now)
 
-                if frame is not None and self.obstacle_detection:
-                    obstacles = self.obstacle_detection.detect_obstacles(frame)
-                    alerts = self.obstacle_detection.get_alerts(obstacles)
+            except Exception as e:
+                self.logger.error(f"Error in detector scheduler: {e}")
+                self._shutdown_event.wait(1)
 
-                    for alert in alerts:
-                        message = self.obstacle_detection.format_alert(alert)
-                        self.audio.announce(message, Priority.CRITICAL)
+    def _timed_run(self, name, handler, frame, data):
+        """Run a detector handler and fold its latency into the EWMA"""
+        start = time.perf_counter()
+        handler(frame, data)
+        elapsed = time.perf_counter() - start
 
-                time.sleep(0.5)  # Check twice per second
+        previous = self.detector_latency.get(name)
+        self.detector_latency[name] = elapsed if previous is None else (
+            self.latency_alpha * elapsed + (1 - self.latency_alpha) * previous
+        )
 
-            except Exception as e:
-                self.logger.error(f"Error in obstacle detection: {e}")
-                time.sleep(1)
+    def _detector_period(self, name, now):
+        """
+        Time until a detector should run again, measured from this run's start
 
-    def _facial_recognition_loop(self):
-        """Background thread for facial recognition"""
-        self.logger.info("Facial recognition thread started")
+        Args:
+            name: Detector name
+            now: Start time of the current run
 
-        while self.is_running:
-            try:
-                frame = self.camera.get_current_frame()
+        Returns:
+            Period in seconds
+        """
+        if name == 'obstacle' and now < self.obstacle_boost_until:
+            return 0.0
 
-                if frame is not None and self.face_recognition:
-                    faces = self.face_recognition.recognize_faces(frame)
+        period = self.detector_periods.get(name, 0.0) * self.thermal_scale
+
+        # Never schedule a detector faster than it can actually run
+        return max(period, self.detector_latency.get(name, 0.0))
+
+    def _update_thermal_scale(self):
+        """Stretch detector periods while the CPU is hot, before firmware throttles"""
+        temperature = read_cpu_temperature()
+        if temperature is None:
+            return
+
+        scale = self.thermal_backoff_factor if temperature > self.thermal_backoff_temp else 1.0
+        if scale != self.thermal_scale:
+            self.logger.warning(
+                f"CPU at {temperature:.1f}C - detector periods scaled by {scale}"
+            )
+            self.thermal_scale = scale
+
+    def _run_obstacle_detection(self, frame, gray=None):
+        """Detect obstacles in frame and announce alerts"""
+        try:
+            if self.obstacle_detection:
+                obstacles = self.obstacle_detection.detect_obstacles(frame, gray=gray)
+                alerts = self.obstacle_detection.get_alerts(obstacles)
+
+                for alert in alerts:
+                    message = self.obstacle_detection.format_alert(alert)
+                    if self._announce_dedup('obst', message, self.obstacle_detection.alert_interval):
+                        self.audio.announce(message, Priority.CRITICAL)
 
-                    for face in faces:
-                        if face['announce'] and face['is_known']:
+        except Exception as e:
+            self.logger.error(f"Error in obstacle detection: {e}")
+
+    def _run_facial_recognition(self, frame, rgb_frame=None):
+        """Recognize faces in frame and greet known people"""
+        try:
+            if self.face_recognition:
+                faces = self.face_recognition.recognize_faces(frame, rgb_frame=rgb_frame)
+
+                for face in faces:
+                    if face['announce'] and face['is_known']:
+                        if self._announce_dedup('face:' + face['name'], face['name']):
                             self.audio.person_detected(face['name'])
 
-                time.sleep(2)  # Check every 2 seconds
+        except Exception as e:
+            self.logger.error(f"Error in facial recognition: {e}")
 
-            except Exception as e:
-                self.logger.error(f"Error in facial recognition: {e}")
-                time.sleep(1)
+    def _run_object_detection(self, frame, input_image=None):
+        """Detect objects in frame and announce a summary"""
+        try:
+            if self.object_detection:
+                objects = self.object_detection.detect_objects(frame, input_image=input_image)
 
-    def _object_detection_loop(self):
-        """Background thread for object detection"""
-        self.logger.info("Object detection thread started")
+                if objects:
+                    summary = self.object_detection.get_object_summary(objects)
+                    if summary and self._announce_dedup('obj', ', '.join(summary)):
+                        self.audio.object_detected(summary)
 
-        while self.is_running:
-            try:
-                frame = self.camera.get_current_frame()
+        except Exception as e:
+            self.logger.error(f"Error in object detection: {e}")
+
+    def _announce_dedup(self, key, text, min_gap=None):
+        """
+        Check whether a detector announcement is new enough to speak
 
-                if frame is not None and self.object_detection:
-                    objects = self.object_detection.detect_objects(frame)
+        Args:
+            key: Announcement source (e.g. 'obj', 'obst', 'face:<name>')
+            text: Text that would be announced
+            min_gap: Seconds within which identical text is dropped
+                (None = audio.repeat_suppression_seconds)
 
-                    if objects:
-                        summary = self.object_detection.get_object_summary(objects)
-                        if summary:
-                            self.audio.object_detected(summary)
+        Returns:
+            True if the announcement should be made
+        """
+        if min_gap is None:
+            min_gap = self.repeat_suppression
 
-                time.sleep(3)  # Check every 3 seconds
+        now = time.time()
+        last = self._last_announce.get(key)
+        if last is not None and last[0] == text and now - last[1] < min_gap:
+            return False
 
-            except Exception as e:
-                self.logger.error(f"Error in object detection: {e}")
-                time.sleep(1)
+        self._last_announce[key] = (text, now)
+        return True
 
     def _storage_monitor_loop(self):
         """Background thread for storage monitoring"""
@@ -357,8 +593,9 @@ class VisionGuardian:
 
         while self.is_running:
             try:
-                # Check storage every 5 minutes
-                time.sleep(300)
+                # Check storage every 5 minutes (returns early on shutdown)
+                if self._shutdown_event.wait(300):
+                    break
 
                 status, needs_attention = self.storage_manager.monitor_storage()
 
@@ -366,20 +603,73 @@ class VisionGuardian:
                     self.logger.warning(status)
 
                 # Perform cleanup if auto-cleanup is enabled
-                if self.config.get('storage.auto_cleanup', True):
+                if self._auto_cleanup:
                     self.storage_manager.perform_cleanup()
 
             except Exception as e:
                 self.logger.error(f"Error in storage monitor: {e}")
-                time.sleep(60)
+                self._shutdown_event.wait(60)
+
+    def _background_command(self, action, handler):
+        """
+        Wrap a voice command handler so it runs on the command pool
+
+        Args:
+            action: Command action name
+            handler: Command handler
+
+        Returns:
+            Callback that submits the handler and returns immediately
+        """
+        def submit(command=None):
+            future = self._inflight.get(action)
+            if future is not None and not future.done():
+                self.logger.info(f"Command already in progress: {action}")
+                return
+
+            self._inflight[action] = self._cmd_pool.submit(self._run_command, action, handler, command)
+
+        return submit
+
+    def _run_command(self, action, handler, command):
+        """Run a command handler on the pool, logging any failure"""
+        try:
+            handler(command)
+        except Exception as e:
+            self.logger.error(f"Error executing command {action}: {e}")
 
     # Voice command handlers
+    def _module_ready(self, attribute: str) -> bool:
+        """
+        Check that a deferred module can serve a voice command, and tell the
+        user why not otherwise (still loading in the background, or disabled)
+
+        Args:
+            attribute: Module attribute name from DEFERRED_MODULES
+
+        Returns:
+            True if the module is loaded
+        """
+        if getattr(self, attribute) is not None:
+            return True
+
+        feature, display_name = next((f, name) for f, attr, _, _, name in self.DEFERRED_MODULES
+                                     if attr == attribute)
+        if self.features_enabled[feature]:
+            self.audio.announce(f"{display_name} is still loading", Priority.MEDIUM)
+        else:
+            self.audio.announce(f"{display_name} is not available", Priority.MEDIUM)
+        return False
+
     def _cmd_read_text(self, command=None):
         """Read text from current view"""
         self.logger.info("Command: Read text")
+        if not self._module_ready('ocr'):
+            return
+
         frame = self.camera.get_current_frame()
 
-        if frame is not None and self.ocr:
+        if frame is not None:
             result = self.ocr.read_text(frame)
             text = self.ocr.format_for_announcement(result)
 
@@ -392,9 +682,12 @@ class VisionGuardian:
     def _cmd_describe_scene(self, command=None):
         """Describe current scene"""
         self.logger.info("Command: Describe scene")
+        if not self._module_ready('scene_description'):
+            return
+
         frame = self.camera.get_current_frame()
 
-        if frame is not None and self.scene_description:
+        if frame is not None:
             description = self.scene_description.describe_scene(frame, force=True)
 
             if description:
@@ -404,9 +697,12 @@ class VisionGuardian:
     def _cmd_identify_people(self, command=None):
         """Identify people in view"""
         self.logger.info("Command: Identify people")
+        if not self._module_ready('face_recognition'):
+            return
+
         frame = self.camera.get_current_frame()
 
-        if frame is not None and self.face_recognition:
+        if frame is not None:
             faces = self.face_recognition.recognize_faces(frame)
 
             if faces:
@@ -423,19 +719,30 @@ class VisionGuardian:
     def _cmd_detect_color(self, command=None):
         """Detect colors"""
         self.logger.info("Command: Detect color")
+        if not self._module_ready('color_detection'):
+            return
+
         frame = self.camera.get_current_frame()
 
-        if frame is not None and self.color_detection:
+        if frame is not None:
             color = self.color_detection.detect_color_at_center(frame)
             self.audio.color_detected(color)
 
     def _cmd_detect_currency(self, command=None):
         """Detect currency"""
         self.logger.info("Command: Detect currency")
+        if not self._module_ready('currency_detection'):
+            return
+
         frame = self.camera.get_current_frame()
 
-        if frame is not None and self.currency_detection:
-            detection = self.currency_detection.detect_currency(frame)
+        if frame is not None:
+            # Hand the frame to the detector's worker thread; detect inline only
+            # if the worker is not running
+            if self.currency_detection.submit(frame):
+                detection = self.currency_detection.wait_for_result(timeout=self.currency_timeout)
+            else:
+                detection = self.currency_detection.detect_currency(frame)
 
             if detection:
                 announcement = self.currency_detection.format_announcement(detection)
@@ -446,6 +753,10 @@ class VisionGuardian:
     def _cmd_check_obstacles(self, command=None):
         """Check for obstacles"""
         self.logger.info("Command: Check obstacles")
+
+        # Give the obstacle detector every frame for a while, ahead of other detectors
+        self.obstacle_boost_until = time.time() + self.obstacle_boost_seconds
+
         frame = self.camera.get_current_frame()
 
         if frame is not None and self.obstacle_detection:
@@ -465,6 +776,10 @@ class VisionGuardian:
 
     def _cmd_stop(self, command=None):
         """Stop all announcements"""
+        # Drop commands that have not started yet
+        for future in self._inflight.values():
+            future.cancel()
+
         self.audio.clear_queue()
         self.audio.announce("Stopped", Priority.HIGH)
 
@@ -475,19 +790,39 @@ class VisionGuardian:
         else:
             self.audio.announce("Nothing to repeat", Priority.MEDIUM)
 
+    def request_shutdown(self):
+        """Ask the main loop to exit; safe to call from a signal handler"""
+        self._shutdown_event.set()
+
     def shutdown(self):
         """Shutdown application"""
+        if self._shutdown_done:
+            return
+        self._shutdown_done = True
+
         self.logger.info("Shutting down VisionGuardian...")
 
         self.is_running = False
+        self._shutdown_event.set()
 
         # Stop voice assistant
         if self.voice_assistant:
             self.voice_assistant.stop_listening()
 
-        # Wait for threads
+        # Wait for threads against one shared deadline, so the total wait is
+        # bounded by 2s rather than 2s per thread
+        deadline = time.monotonic() + 2
         for thread in self.threads:
-            thread.join(timeout=2)
+            thread.join(timeout=max(0.0, deadline - time.monotonic()))
+
+        # Let in-flight detector runs finish without blocking shutdown
+        if self.detector_executor:
+            self.detector_executor.shutdown(wait=False)
+        self._cmd_pool.shutdown(wait=False, cancel_futures=True)
+
+        # Stop module background workers
+        if self.currency_detection:
+            self.currency_detection.stop()
 
         # Release camera
         if self.camera:
@@ -510,25 +845,37 @@ def main():
     print("=" * 60)
     print()
 
-    # Create application
-    app = VisionGuardian()
-
-    # Initialize
-    if not app.initialize():
-        print("Failed to initialize VisionGuardian")
-        return 1
+    app = None
 
-    # Setup signal handlers
+    # Setup signal handlers before any thread exists. Once running, shutdown
+    # goes through the normal path: the main loop exits and start() calls
+    # shutdown(). During initialize() a signal aborts it instead.
     def signal_handler(sig, frame):
         print("\nShutting down...")
-        app.shutdown()
-        sys.exit(0)
+        if app is None:
+            sys.exit(0)
+        if not app.is_running:
+            raise KeyboardInterrupt
+        app.request_shutdown()
 
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
 
-    # Start application
-    app.start()
+    # Create application
+    app = VisionGuardian()
+
+    # Signals before start() sets is_running (during initialize() or just
+    # after it returns) raise KeyboardInterrupt here; shutdown() is idempotent
+    try:
+        # Initialize
+        if not app.initialize():
+            print("Failed to initialize VisionGuardian")
+            return 1
+
+        # Start application
+        app.start()
+    except KeyboardInterrupt:
+        app.shutdown()
 
     return 0
 
@@ -52,6 +52,12 @@ class ObjectDetection:
         self.max_objects_announce = config.get('object_detection.max_objects_announce', 3)
         self.detection_interval = config.get('object_detection.detection_interval_seconds', 1)
         self.nms_threshold = config.get('object_detection.nms_threshold', 0.5)
+        # One interpreter thread per core the detector workers are pinned to;
+        # more would only oversubscribe those cores
+        self.num_threads = config.get(
+            'object_detection.num_threads',
+            len(config.get('performance.detector_cpu_cores', [0, 1, 2]))
+        )
 
         # Model
         self.interpreter = None
@@ -97,12 +103,18 @@ class ObjectDetection:
 
             self.logger.info(f"Loading model: {self.model_path}")
 
-            # Create interpreter
+            # Create interpreter (multi-threaded XNNPACK kernels use all A76 cores)
             try:
-                self.interpreter = Interpreter(model_path=str(self.model_path))
+                self.interpreter = Interpreter(
+                    model_path=str(self.model_path),
+                    num_threads=self.num_threads
+                )
             except NameError:
                 # Using full TensorFlow
-                self.interpreter = tf.lite.Interpreter(model_path=str(self.model_path))
+                self.interpreter = tf.lite.Interpreter(
+                    model_path=str(self.model_path),
+                    num_threads=self.num_threads
+                )
 
             self.interpreter.allocate_tensors()
 
@@ -113,6 +125,7 @@ class ObjectDetection:
             # Log model info
             input_shape = self.input_details[0]['shape']
             self.logger.info(f"Model input shape: {input_shape}")
+            self.logger.info(f"Inference threads: {self.num_threads}")
             self.logger.info(f"Model loaded successfully")
 
             # Warm up model
@@ -162,13 +175,16 @@ class ObjectDetection:
         except Exception as e:
             self.logger.error(f"Error during model warmup: {e}")
 
-    def detect_objects(self, frame: np.ndarray, force: bool = False) -> List[Dict]:
+    def detect_objects(self, frame: np.ndarray, force: bool = False,
+                       input_image: Optional[np.ndarray] = None) -> List[Dict]:
         """
         Detect objects in frame
 
         Args:
             frame: Input frame (BGR format)
             force: Force detection regardless of interval
+            input_image: Optional frame already resized to the model input
+                size and converted to RGB (see get_input_size)
 
         Returns:
             List of detected objects with info
@@ -185,8 +201,13 @@ class ObjectDetection:
         detected_objects = []
 
         try:
-            # Preprocess frame
-            input_data = self._preprocess_frame(frame)
+            self._set_batch_size(1)
+
+            # Preprocess frame (unless the caller already did)
+            if input_image is not None:
+                input_data = self._to_input_tensor(input_image)
+            else:
+                input_data = self._preprocess_frame(frame)
 
             # Run inference
             self.interpreter.set_tensor(self.input_details[0]['index'], input_data)
@@ -194,42 +215,8 @@ class ObjectDetection:
 
             # Get outputs
             # For SSD MobileNet, outputs are: boxes, classes, scores, num_detections
-            boxes = self.interpreter.get_tensor(self.output_details[0]['index'])[0]
-            classes = self.interpreter.get_tensor(self.output_details[1]['index'])[0]
-            scores = self.interpreter.get_tensor(self.output_details[2]['index'])[0]
-            num_detections = int(self.interpreter.get_tensor(self.output_details[3]['index'])[0])
-
-            # Process detections
             height, width = frame.shape[:2]
-
-            for i in range(min(num_detections, 10)):  # Process top 10 detections
-                score = scores[i]
-
-                if score < self.confidence_threshold:
-                    continue
-
-                # Get class and label
-                class_id = int(classes[i])
-                label = self.labels[class_id] if class_id < len(self.labels) else f"Class {class_id}"
-
-                # Get bounding box (normalized coordinates)
-                ymin, xmin, ymax, xmax = boxes[i]
-
-                # Convert to pixel coordinates
-                left = int(xmin * width)
-                right = int(xmax * width)
-                top = int(ymin * height)
-                bottom = int(ymax * height)
-
-                detection = {
-                    'label': label,
-                    'class_id': class_id,
-                    'confidence': float(score),
-                    'bbox': (left, top, right, bottom),
-                    'center': ((left + right) // 2, (top + bottom) // 2)
-                }
-
-                detected_objects.append(detection)
+            detected_objects = self._parse_detections(0, width, height)
 
             # Apply Non-Maximum Suppression to remove duplicate detections
             detected_objects = self._apply_nms(detected_objects)
@@ -247,6 +234,115 @@ class ObjectDetection:
         self.performance.end('object_detection')
         return detected_objects
 
+    def detect_objects_batch(self, frames: List[np.ndarray]) -> List[List[Dict]]:
+        """
+        Detect objects in several frames with a single inference call
+
+        The interpreter input is resized to the batch size when it changes.
+        Models that cannot be resized (e.g. some SSD post-processing ops)
+        fall back to one inference per frame.
+
+        Args:
+            frames: Input frames (BGR format)
+
+        Returns:
+            List of detection lists, one per frame
+        """
+        if not self.enabled or not TFLITE_AVAILABLE or self.interpreter is None or not frames:
+            return [[] for _ in frames]
+
+        self.performance.start('object_detection_batch')
+        results = []
+
+        try:
+            self._set_batch_size(len(frames))
+
+            input_data = np.concatenate([self._preprocess_frame(f) for f in frames], axis=0)
+            self.interpreter.set_tensor(self.input_details[0]['index'], input_data)
+            self.interpreter.invoke()
+
+            for b, frame in enumerate(frames):
+                height, width = frame.shape[:2]
+                results.append(self._apply_nms(self._parse_detections(b, width, height)))
+
+        except Exception as e:
+            self.logger.debug(f"Batched inference unavailable ({e}), running per frame")
+            self._set_batch_size(1)
+            results = [self.detect_objects(f, force=True) for f in frames]
+
+        self.performance.end('object_detection_batch')
+        return results
+
+    def get_input_size(self) -> Optional[Tuple[int, int]]:
+        """Get model input size (width, height), or None if not loaded"""
+        if self.input_details is None:
+            return None
+
+        input_shape = self.input_details[0]['shape']
+        return (int(input_shape[2]), int(input_shape[1]))
+
+    def _set_batch_size(self, batch_size: int):
+        """Resize the interpreter input batch dimension if it changed"""
+        # Read the shape back from the interpreter: a resize whose
+        # allocate_tensors() failed leaves it changed but our copy stale
+        self.input_details = self.interpreter.get_input_details()
+        if self.input_details[0]['shape'][0] == batch_size:
+            return
+
+        shape = list(self.input_details[0]['shape'])
+        shape[0] = batch_size
+        self.interpreter.resize_tensor_input(self.input_details[0]['index'], shape)
+        self.interpreter.allocate_tensors()
+
+        self.input_details = self.interpreter.get_input_details()
+        self.output_details = self.interpreter.get_output_details()
+
+    def _parse_detections(self, batch_index: int, width: int, height: int) -> List[Dict]:
+        """
+        Convert raw SSD outputs for one batch element to detection dicts
+
+        Args:
+            batch_index: Index into the output batch
+            width: Frame width in pixels
+            height: Frame height in pixels
+
+        Returns:
+            List of detections above the confidence threshold
+        """
+        boxes = self.interpreter.get_tensor(self.output_details[0]['index'])[batch_index]
+        classes = self.interpreter.get_tensor(self.output_details[1]['index'])[batch_index]
+        scores = self.interpreter.get_tensor(self.output_details[2]['index'])[batch_index]
+        num_detections = int(self.interpreter.get_tensor(self.output_details[3]['index'])[batch_index])
+
+        # Top 10 detections above the threshold, converted to pixel
+        # coordinates in one array operation
+        count = min(num_detections, 10)
+        keep = np.flatnonzero(scores[:count] >= self.confidence_threshold)
+        if keep.size == 0:
+            return []
+
+        # Normalized (ymin, xmin, ymax, xmax) -> (top, left, bottom, right)
+        pixels = (boxes[keep] * np.array([height, width, height, width], dtype=np.float32)).astype(np.int32)
+        centers_x = (pixels[:, 1] + pixels[:, 3]) // 2
+        centers_y = (pixels[:, 0] + pixels[:, 2]) // 2
+
+        detected_objects = []
+
+        for class_id, score, (top, left, bottom, right), cx, cy in zip(
+                classes[keep].astype(np.int32).tolist(), scores[keep].tolist(),
+                pixels.tolist(), centers_x.tolist(), centers_y.tolist()):
+            label = self.labels[class_id] if class_id < len(self.labels) else f"Class {class_id}"
+
+            detected_objects.append({
+                'label': label,
+                'class_id': class_id,
+                'confidence': score,
+                'bbox': (left, top, right, bottom),
+                'center': (cx, cy)
+            })
+
+        return detected_objects
+
     def _preprocess_frame(self, frame: np.ndarray) -> np.ndarray:
         """
         Preprocess frame for model input
@@ -267,6 +363,18 @@ class ObjectDetection:
         # Convert BGR to RGB
         rgb = cv2.cvtColor(resized, cv2.COLOR_BGR2RGB)
 
+        return self._to_input_tensor(rgb)
+
+    def _to_input_tensor(self, rgb: np.ndarray) -> np.ndarray:
+        """
+        Convert a resized RGB image to the model input tensor
+
+        Args:
+            rgb: RGB image at the model input size
+
+        Returns:
+            Input tensor with batch dimension
+        """
         # Expand dimensions to match model input
         input_data = np.expand_dims(rgb, axis=0)
 
@@ -36,7 +36,7 @@ class ObstacleDetection:
         self.zone_names = ['left', 'center', 'right']
 
         # Camera calibration (should be calibrated for specific camera)
-        self.focal_length = 600  # pixels (approximate, needs calibration)
+        self.focal_length = config.get('obstacle_detection.focal_length_px', 600)  # pixels (run scripts/calibrate.py)
         self.known_width = 60    # cm (average person width)
 
         # Performance
@@ -77,12 +77,14 @@ class ObstacleDetection:
         self.logger.info("Depth estimation not yet implemented")
         pass
 
-    def detect_obstacles(self, frame: np.ndarray) -> List[Dict]:
+    def detect_obstacles(self, frame: np.ndarray,
+                         gray: Optional[np.ndarray] = None) -> List[Dict]:
         """
         Detect obstacles in frame
 
         Args:
             frame: Input frame
+            gray: Optional grayscale version of frame, if already converted
 
         Returns:
             List of obstacle detections with distances
@@ -95,7 +97,7 @@ class ObstacleDetection:
 
         try:
             # Simple obstacle detection using edge detection and contours
-            obstacles = self._detect_using_contours(frame)
+            obstacles = self._detect_using_contours(frame, gray)
 
             # Filter by distance threshold
             obstacles = [obs for obs in obstacles if obs['distance'] <= self.min_distance]
@@ -109,12 +111,14 @@ class ObstacleDetection:
         self.performance.end('obstacle_detection')
         return obstacles
 
-    def _detect_using_contours(self, frame: np.ndarray) -> List[Dict]:
+    def _detect_using_contours(self, frame: np.ndarray,
+                               gray: Optional[np.ndarray] = None) -> List[Dict]:
         """
         Detect obstacles using edge detection and contours
 
         Args:
             frame: Input frame
+            gray: Optional grayscale version of frame
 
         Returns:
             List of obstacles
@@ -123,7 +127,8 @@ class ObstacleDetection:
         obstacles = []
 
         # Convert to grayscale
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        if gray is None:
+            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
 
         # Apply Gaussian blur
         blurred = cv2.GaussianBlur(gray, (5, 5), 0)
@@ -5,8 +5,10 @@ Optimized for Raspberry Pi 5 (64-bit ARM64)
 """
 
 import cv2
+import ctypes
 import numpy as np
 import logging
+import re
 import time
 from typing import List, Dict, Optional, Tuple
 
@@ -17,6 +19,12 @@ except ImportError:
     TESSERACT_AVAILABLE = False
     logging.warning("pytesseract not available")
 
+try:
+    import tesserocr
+    TESSEROCR_AVAILABLE = True
+except ImportError:
+    TESSEROCR_AVAILABLE = False
+
 try:
     import easyocr
     EASYOCR_AVAILABLE = True
@@ -24,7 +32,74 @@ except ImportError:
     EASYOCR_AVAILABLE = False
     logging.warning("easyocr not available")
 
-from utils import Config, PerformanceMonitor
+try:
+    import torchfree_ocr
+    TORCHFREE_OCR_AVAILABLE = True
+except ImportError:
+    TORCHFREE_OCR_AVAILABLE = False
+
+from utils import Config, PerformanceMonitor, PerceptualHashCache, SRC_DIR
+
+
+NATIVE_LIB_FILE = SRC_DIR / 'native' / 'libadaptive_threshold.so'
+
+# `tesseract --version` result, probed once per process
+_TESS_VERSION_CACHE = None
+
+# Sentence terminators; runs like '?!' or '...' count as one break
+_SENTENCE_SPLIT = re.compile(r'[.!?]+')
+
+
+def _load_native_lib() -> Optional[ctypes.CDLL]:
+    """Load the compiled adaptive threshold kernel (built with `make native`), if present"""
+    if not NATIVE_LIB_FILE.exists():
+        return None
+
+    try:
+        lib = ctypes.CDLL(str(NATIVE_LIB_FILE))
+        lib.adaptive_threshold_mean.argtypes = [
+            ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p,
+            ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int
+        ]
+        lib.adaptive_threshold_mean.restype = None
+        return lib
+    except (OSError, AttributeError) as e:
+        logging.warning(f"Could not load native threshold kernel: {e}")
+        return None
+
+
+_NATIVE_LIB = _load_native_lib()
+
+
+def _adaptive_threshold(gray: np.ndarray, block: int = 11, c: int = 2,
+                        dst: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Binarize against the local block x block mean minus c
+
+    Uses the native summed-area-table kernel when built, otherwise OpenCV's
+    ADAPTIVE_THRESH_MEAN_C (same rule, differing only at the image border).
+
+    Args:
+        gray: Single-channel uint8 image
+        block: Odd neighbourhood size
+        c: Constant subtracted from the mean
+        dst: Optional output buffer, same shape as gray
+
+    Returns:
+        Binary image (0/255)
+    """
+    if _NATIVE_LIB is None:
+        return cv2.adaptiveThreshold(gray, 255, cv2.ADAPTIVE_THRESH_MEAN_C, cv2.THRESH_BINARY, block, c, dst=dst)
+
+    gray = np.ascontiguousarray(gray)
+    integral = cv2.integral(gray, sdepth=cv2.CV_32S)
+    binary = dst if dst is not None else np.empty_like(gray)
+    height, width = gray.shape
+    _NATIVE_LIB.adaptive_threshold_mean(
+        gray.ctypes.data, integral.ctypes.data, binary.ctypes.data,
+        width, height, block, c
+    )
+    return binary
 
 
 class OCRModule:
@@ -38,13 +113,38 @@ class OCRModule:
         self.enabled = config.get('ocr.enabled', True)
         self.engine = config.get('ocr.engine', 'tesseract')
         self.languages = config.get('ocr.languages', ['eng'])
+        self.tesseract_config = config.get('ocr.tesseract_config', '--oem 1 --psm 6')
         self.confidence_threshold = config.get('ocr.confidence_threshold', 60)
         self.preprocessing = config.get('ocr.preprocessing', True)
+        self.preprocess_mode = config.get('ocr.preprocess_mode', 'fast')
+        self.uneven_lighting_threshold = config.get('ocr.uneven_lighting_threshold', 30.0)
+        self.use_opencl = config.get('ocr.use_opencl', False) and cv2.ocl.haveOpenCL()
         self.detect_orientation = config.get('ocr.detect_orientation', True)
+        self.orientation_cache_seconds = config.get('ocr.orientation_cache_seconds', 5.0)
         self.announcement_mode = config.get('ocr.announcement_mode', 'sentences')
+        self.max_image_dimension = config.get('ocr.max_image_dimension', 1280)
+        self.quantize = config.get('ocr.quantize', True)
+        self.detect_max_dimension = config.get('ocr.detect_max_dimension', 640)
 
         # OCR engine
         self.reader = None
+        self._tess_lang = '+'.join(self.languages)
+        self._tapi = None
+
+        # Last OSD rotation and when it was measured; the device is rarely
+        # turned between consecutive reads, so OSD need not run every frame
+        self._osd_cache = (0, 0.0)
+
+        # Preprocessing scratch buffers, sized on first frame and reused
+        self._gray_buf = None
+        self._blur_buf = None
+        self._bin_buf = None
+
+        # Results for recently read views, so 'read text' on the same page is instant
+        self.result_cache = PerceptualHashCache(
+            capacity=config.get('ocr.result_cache_size', 8),
+            ttl=config.get('ocr.result_cache_seconds', 60)
+        )
 
         # Performance
         self.performance = PerformanceMonitor()
@@ -62,15 +162,28 @@ class OCRModule:
         try:
             self.logger.info(f"Initializing OCR engine: {self.engine}")
 
-            if self.engine == 'tesseract':
+            if self.engine == 'tesseract' and TESSEROCR_AVAILABLE:
+                # Link libtesseract in-process: no subprocess fork or PNG round trip
+                psm = re.search(r'--psm\s+(\d+)', self.tesseract_config)
+                oem = re.search(r'--oem\s+(\d+)', self.tesseract_config)
+                self._tapi = tesserocr.PyTessBaseAPI(
+                    lang=self._tess_lang,
+                    psm=int(psm.group(1)) if psm else tesserocr.PSM.AUTO,
+                    oem=int(oem.group(1)) if oem else tesserocr.OEM.DEFAULT
+                )
+                self.logger.info(f"Tesseract (tesserocr) version: {tesserocr.tesseract_version().splitlines()[0]}")
+
+            elif self.engine == 'tesseract':
                 if not TESSERACT_AVAILABLE:
                     self.logger.error("Tesseract not available")
                     return False
 
                 # Test tesseract
+                global _TESS_VERSION_CACHE
                 try:
-                    version = pytesseract.get_tesseract_version()
-                    self.logger.info(f"Tesseract version: {version}")
+                    if _TESS_VERSION_CACHE is None:
+                        _TESS_VERSION_CACHE = pytesseract.get_tesseract_version()
+                    self.logger.info(f"Tesseract version: {_TESS_VERSION_CACHE}")
                 except Exception as e:
                     self.logger.error(f"Tesseract not properly installed: {e}")
                     return False
@@ -82,13 +195,27 @@ class OCRModule:
 
                 # Initialize EasyOCR reader
                 self.logger.info("Loading EasyOCR model (this may take a moment)...")
-                self.reader = easyocr.Reader(self.languages, gpu=False)
+                self.reader = easyocr.Reader(self.languages, gpu=False, quantize=self.quantize)
                 self.logger.info("EasyOCR initialized")
 
+            elif self.engine == 'easyocr_onnx':
+                if not TORCHFREE_OCR_AVAILABLE:
+                    self.logger.error("torchfree_ocr not available")
+                    return False
+
+                # ONNX Runtime port of EasyOCR: same readtext() API, no PyTorch
+                self.logger.info("Loading EasyOCR ONNX model (this may take a moment)...")
+                self.reader = torchfree_ocr.Reader(self.languages)
+                self.logger.info("EasyOCR ONNX initialized")
+
             else:
                 self.logger.error(f"Unknown OCR engine: {self.engine}")
                 return False
 
+            if self.use_opencl:
+                cv2.ocl.setUseOpenCL(True)
+                self.logger.info(f"OCR preprocessing on OpenCL device: {cv2.ocl.Device.getDefault().name()}")
+
             self.logger.info("OCR module initialized")
             return True
 
@@ -96,6 +223,20 @@ class OCRModule:
             self.logger.error(f"Error initializing OCR: {e}")
             return False
 
+    def warmup(self):
+        """
+        Run the EasyOCR reader once on a blank strip, so the first
+        'read text' command does not pay the one-off allocation cost
+        """
+        if self.reader is None:
+            return
+
+        try:
+            self.reader.readtext(np.full((32, 128), 255, dtype=np.uint8))
+            self.logger.info("OCR reader warmed up")
+        except Exception as e:
+            self.logger.warning(f"Could not warm up OCR reader: {e}")
+
     def read_text(self, frame: np.ndarray) -> Dict:
         """
         Read text from frame
@@ -112,6 +253,18 @@ class OCRModule:
         self.performance.start('ocr')
 
         try:
+            frame_hash = self.result_cache.hash(frame)
+            cached = self.result_cache.get(frame_hash)
+            if cached is not None:
+                self.logger.debug("OCR result served from cache")
+                self.performance.end('ocr')
+                return cached
+
+            # Cap the long edge; Tesseract needs ~300 DPI text, not sensor resolution
+            scale = min(1.0, self.max_image_dimension / max(frame.shape[:2]))
+            if scale < 1.0:
+                frame = cv2.resize(frame, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+
             # Preprocess image
             if self.preprocessing:
                 processed = self._preprocess_image(frame)
@@ -119,13 +272,24 @@ class OCRModule:
                 processed = frame
 
             # Run OCR based on engine
-            if self.engine == 'tesseract':
+            if self.engine == 'tesseract' and self._tapi is not None:
+                result = self._ocr_tesserocr(processed)
+            elif self.engine == 'tesseract':
                 result = self._ocr_tesseract(processed)
-            elif self.engine == 'easyocr':
+            elif self.engine in ('easyocr', 'easyocr_onnx'):
                 result = self._ocr_easyocr(processed)
             else:
                 result = {'text': '', 'confidence': 0, 'lines': []}
 
+            # Report boxes in the caller's frame coordinates
+            if scale < 1.0:
+                for line in result['lines']:
+                    line['bbox'] = tuple(int(v / scale) for v in line['bbox'])
+
+            # Empty reads are not cached, so asking again retries the OCR
+            if result['text']:
+                self.result_cache.put(frame_hash, result)
+
             self.performance.end('ocr')
             return result
 
@@ -142,30 +306,63 @@ class OCRModule:
             image: Input image
 
         Returns:
-            Preprocessed image
+            Preprocessed image. On the CPU path this is a reused buffer that
+            the next call overwrites; copy it to keep it.
         """
+        gray_buf = blur_buf = bin_buf = None
+
+        # Keep the whole chain on the OpenCL device; only the result comes back
+        if self.use_opencl:
+            image = cv2.UMat(image)
+        else:
+            shape = image.shape[:2]
+            if self._gray_buf is None or self._gray_buf.shape != shape:
+                self._gray_buf = np.empty(shape, dtype=np.uint8)
+                self._blur_buf = np.empty(shape, dtype=np.uint8)
+                self._bin_buf = np.empty(shape, dtype=np.uint8)
+            gray_buf, blur_buf, bin_buf = self._gray_buf, self._blur_buf, self._bin_buf
+
         # Convert to grayscale
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-
-        # Apply bilateral filter to reduce noise while keeping edges sharp
-        denoised = cv2.bilateralFilter(gray, 9, 75, 75)
-
-        # Apply adaptive thresholding
-        binary = cv2.adaptiveThreshold(
-            denoised,
-            255,
-            cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
-            cv2.THRESH_BINARY,
-            11,
-            2
-        )
+        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY, dst=gray_buf)
+
+        if self.preprocess_mode == 'bilateral':
+            # Edge-preserving but expensive; only worth it on very noisy input
+            denoised = cv2.bilateralFilter(gray, 9, 75, 75, dst=blur_buf)
+            uneven = True
+        else:
+            # Separable 3x3 Gaussian is enough to knock out sensor noise
+            denoised = cv2.GaussianBlur(gray, (3, 3), 0, dst=blur_buf)
+
+            # Estimate the illumination field on a coarse thumbnail; text
+            # averages out at this size, so a large spread means uneven light
+            illumination = cv2.resize(gray, (32, 32), interpolation=cv2.INTER_AREA)
+            if self.use_opencl:
+                illumination = illumination.get()
+            uneven = illumination.std() > self.uneven_lighting_threshold
+
+        if uneven and self.use_opencl:
+            binary = cv2.adaptiveThreshold(denoised, 255, cv2.ADAPTIVE_THRESH_MEAN_C, cv2.THRESH_BINARY, 11, 2)
+        elif uneven:
+            # Apply adaptive thresholding
+            binary = _adaptive_threshold(denoised, 11, 2, dst=bin_buf)
+        else:
+            # Single global threshold for evenly lit pages
+            _, binary = cv2.threshold(denoised, 0, 255, cv2.THRESH_BINARY | cv2.THRESH_OTSU, dst=bin_buf)
+
+        if self.use_opencl:
+            binary = binary.get()
 
         # Optional: Detect and correct orientation
         if self.detect_orientation:
             try:
-                # Detect orientation using Tesseract
-                osd = pytesseract.image_to_osd(binary)
-                angle = int([line for line in osd.split('\n') if 'Rotate:' in line][0].split(':')[1].strip())
+                angle, measured_at = self._osd_cache
+                now = time.time()
+                if now - measured_at > self.orientation_cache_seconds:
+                    # Detect orientation using Tesseract
+                    osd = pytesseract.image_to_osd(binary)
+                    rotate = next(line for line in osd.split('\n') if line.startswith('Rotate:'))
+                    angle = int(rotate.split(':')[1].strip())
+                    self._osd_cache = (angle, now)
 
                 if angle != 0:
                     # Rotate image
@@ -192,46 +389,92 @@ class OCRModule:
         """
         try:
             # Get detailed OCR data
-            lang = '+'.join(self.languages)
             data = pytesseract.image_to_data(
                 image,
-                lang=lang,
+                lang=self._tess_lang,
+                config=self.tesseract_config,
                 output_type=pytesseract.Output.DICT
             )
 
-            # Filter by confidence
+            # Filter by confidence; page/block/line rows carry conf -1 and no text
+            conf = np.asarray(data['conf'], dtype=np.float32)
+            candidates = np.flatnonzero((conf != -1) & (conf >= self.confidence_threshold))
+            words = data['text']
+            keep = [i for i in candidates if words[i].strip()]
+
+            left = np.asarray(data['left'])[keep]
+            top = np.asarray(data['top'])[keep]
+            right = left + np.asarray(data['width'])[keep]
+            bottom = top + np.asarray(data['height'])[keep]
+            text_parts = [words[i].strip() for i in keep]
+
+            lines = [
+                {
+                    'text': text,
+                    'confidence': float(c),
+                    'bbox': (int(l), int(t), int(r), int(b))
+                }
+                for text, c, l, t, r, b in zip(text_parts, conf[keep], left, top, right, bottom)
+            ]
+
+            # Combine text
+            full_text = ' '.join(text_parts)
+
+            # Calculate average confidence
+            avg_confidence = float(conf[keep].mean()) if keep else 0
+
+            return {
+                'text': full_text,
+                'confidence': avg_confidence,
+                'lines': lines
+            }
+
+        except Exception as e:
+            self.logger.error(f"Tesseract OCR error: {e}")
+            return {'text': '', 'confidence': 0, 'lines': []}
+
+    def _ocr_tesserocr(self, image: np.ndarray) -> Dict:
+        """
+        Perform OCR using the in-process Tesseract API
+
+        Args:
+            image: Preprocessed image (grayscale/binary or BGR)
+
+        Returns:
+            OCR results
+        """
+        try:
+            if image.ndim == 3:
+                image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+            image = np.ascontiguousarray(image)
+            height, width = image.shape[:2]
+            channels = 1 if image.ndim == 2 else image.shape[2]
+
+            self._tapi.SetImageBytes(image.tobytes(), width, height, channels, width * channels)
+            self._tapi.Recognize()
+
             lines = []
             text_parts = []
+            level = tesserocr.RIL.WORD
+            iterator = self._tapi.GetIterator()
+            words = tesserocr.iterate_level(iterator, level) if iterator is not None else []
 
-            for i in range(len(data['text'])):
-                text = data['text'][i].strip()
-                confidence = data['conf'][i]
+            for word in words:
+                text = (word.GetUTF8Text(level) or '').strip()
+                confidence = word.Confidence(level)
 
-                if text and confidence != -1 and confidence >= self.confidence_threshold:
-                    line_info = {
+                if text and confidence >= self.confidence_threshold and word.BoundingBox(level):
+                    lines.append({
                         'text': text,
                         'confidence': confidence,
-                        'bbox': (
-                            data['left'][i],
-                            data['top'][i],
-                            data['left'][i] + data['width'][i],
-                            data['top'][i] + data['height'][i]
-                        )
-                    }
-                    lines.append(line_info)
+                        'bbox': word.BoundingBox(level)
+                    })
                     text_parts.append(text)
 
-            # Combine text
-            full_text = ' '.join(text_parts)
-
-            # Calculate average confidence
-            if lines:
-                avg_confidence = sum(line['confidence'] for line in lines) / len(lines)
-            else:
-                avg_confidence = 0
+            avg_confidence = sum(line['confidence'] for line in lines) / len(lines) if lines else 0
 
             return {
-                'text': full_text,
+                'text': ' '.join(text_parts),
                 'confidence': avg_confidence,
                 'lines': lines
             }
@@ -255,41 +498,37 @@ class OCRModule:
                 return {'text': '', 'confidence': 0, 'lines': []}
 
             # Run EasyOCR
-            results = self.reader.readtext(image)
+            if hasattr(self.reader, 'detect') and hasattr(self.reader, 'recognize'):
+                results = self._easyocr_detect_recognize(image)
+            else:
+                results = self.reader.readtext(image)
 
-            lines = []
-            text_parts = []
+            # Filter by confidence
+            kept = [r for r in results if r[2] * 100 >= self.confidence_threshold]
+            text_parts = [text for _, text, _ in kept]
 
-            for bbox, text, confidence in results:
-                confidence_percent = confidence * 100
-
-                if confidence_percent >= self.confidence_threshold:
-                    # Convert bbox to simple format
-                    x_coords = [point[0] for point in bbox]
-                    y_coords = [point[1] for point in bbox]
-                    bbox_simple = (
-                        int(min(x_coords)),
-                        int(min(y_coords)),
-                        int(max(x_coords)),
-                        int(max(y_coords))
-                    )
-
-                    line_info = {
+            lines = []
+            if kept:
+                # Corner points of all boxes at once: (N, 4, 2) -> per-box extents
+                corners = np.array([bbox for bbox, _, _ in kept], dtype=np.float32)
+                mins = corners.min(axis=1).astype(np.int32)
+                maxs = corners.max(axis=1).astype(np.int32)
+                confidences = np.array([confidence for _, _, confidence in kept]) * 100
+
+                lines = [
+                    {
                         'text': text,
-                        'confidence': confidence_percent,
-                        'bbox': bbox_simple
+                        'confidence': float(c),
+                        'bbox': (int(x0), int(y0), int(x1), int(y1))
                     }
-                    lines.append(line_info)
-                    text_parts.append(text)
+                    for text, c, (x0, y0), (x1, y1) in zip(text_parts, confidences, mins, maxs)
+                ]
 
             # Combine text
             full_text = ' '.join(text_parts)
 
             # Calculate average confidence
-            if lines:
-                avg_confidence = sum(line['confidence'] for line in lines) / len(lines)
-            else:
-                avg_confidence = 0
+            avg_confidence = float(confidences.mean()) if kept else 0
 
             return {
                 'text': full_text,
@@ -301,6 +540,33 @@ class OCRModule:
             self.logger.error(f"EasyOCR error: {e}")
             return {'text': '', 'confidence': 0, 'lines': []}
 
+    def _easyocr_detect_recognize(self, image: np.ndarray) -> List:
+        """
+        Find text regions on a downscaled copy, then recognize all of them
+        in one batched pass at full resolution
+
+        Args:
+            image: Preprocessed image
+
+        Returns:
+            List of (bbox, text, confidence) tuples, as from readtext()
+        """
+        scale = min(1.0, self.detect_max_dimension / max(image.shape[:2]))
+        if scale < 1.0:
+            small = cv2.resize(image, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+        else:
+            small = image
+
+        horizontal_list, free_list = self.reader.detect(small)
+        horizontal = [[int(v / scale) for v in box] for box in horizontal_list[0]]
+        free = [[[x / scale, y / scale] for x, y in poly] for poly in free_list[0]]
+
+        if not horizontal and not free:
+            return []
+
+        gray = image if image.ndim == 2 else cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        return self.reader.recognize(gray, horizontal_list=horizontal, free_list=free)
+
     def format_for_announcement(self, ocr_result: Dict) -> str:
         """
         Format OCR text for audio announcement
@@ -322,8 +588,7 @@ class OCRModule:
 
         elif self.announcement_mode == 'sentences':
             # Break into sentences and announce first few
-            sentences = text.replace('!', '.').replace('?', '.').split('.')
-            sentences = [s.strip() for s in sentences if s.strip()]
+            sentences = [s.strip() for s in _SENTENCE_SPLIT.split(text) if s.strip()]
             return '. '.join(sentences[:3])  # First 3 sentences
 
         elif self.announcement_mode == 'words':
@@ -344,20 +609,28 @@ class OCRModule:
         Returns:
             Frame with text boxes drawn
         """
-        for line in ocr_result.get('lines', []):
-            left, top, right, bottom = line['bbox']
-            text = line['text']
-            confidence = line['confidence']
-
-            # Draw box
-            cv2.rectangle(frame, (left, top), (right, bottom), (255, 0, 0), 2)
-
-            # Draw text label
-            label = f"{confidence:.0f}%"
+        lines = ocr_result.get('lines', [])
+        if not lines:
+            return frame
+
+        # Draw all boxes in one call
+        bboxes = np.array([line['bbox'] for line in lines], dtype=np.int32)
+        left, top, right, bottom = bboxes.T
+        boxes = np.stack([
+            np.stack([left, top], axis=1),
+            np.stack([right, top], axis=1),
+            np.stack([right, bottom], axis=1),
+            np.stack([left, bottom], axis=1),
+        ], axis=1)
+        cv2.polylines(frame, list(boxes), isClosed=True, color=(255, 0, 0), thickness=2)
+
+        # Draw text labels
+        labels = [f"{line['confidence']:.0f}%" for line in lines]
+        for label, x, y in zip(labels, left.tolist(), np.maximum(top - 5, 0).tolist()):
             cv2.putText(
                 frame,
                 label,
-                (left, max(top - 5, 0)),
+                (x, y),
                 cv2.FONT_HERSHEY_SIMPLEX,
                 0.5,
                 (255, 0, 0),
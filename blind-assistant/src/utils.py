@@ -4,17 +4,26 @@ Optimized for Raspberry Pi 5 (64-bit ARM64)
 """
 
 import os
+import sys
 import yaml
 import logging
 import time
 import json
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, Optional, Tuple, Iterable, Set
 import numpy as np
 import cv2
 import psutil
 import platform
+import threading
+from collections import OrderedDict
+from multiprocessing import resource_tracker, shared_memory
+
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
 
 
 # Project paths
@@ -30,12 +39,47 @@ CACHE_DIR = PROJECT_ROOT / "cache"
 for directory in [MODELS_DIR, DATA_DIR, LOGS_DIR, CACHE_DIR]:
     directory.mkdir(parents=True, exist_ok=True)
 
+# Hand-edited settings, and tool-written overrides applied on top of them
+SETTINGS_FILE = CONFIG_DIR / "settings.yaml"
+SETTINGS_OVERRIDE_FILE = CONFIG_DIR / "settings.override.json"
+
+
+def merge_settings(base: Dict, overrides: Dict) -> Dict:
+    """
+    Recursively merge override settings into base settings (in place)
+
+    Nested sections are merged key by key, so an override only replaces
+    the leaves it names.
+
+    Args:
+        base: Settings to update
+        overrides: Settings taking precedence
+
+    Returns:
+        The updated base dictionary
+    """
+    for key, value in overrides.items():
+        if isinstance(value, dict) and isinstance(base.get(key), dict):
+            merge_settings(base[key], value)
+        else:
+            base[key] = value
+    return base
+
+
+def _file_mtime_ns(path: Path) -> Optional[int]:
+    """Modification time of path in ns, or None if it does not exist"""
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
 
 class Config:
     """Configuration manager for loading and accessing settings"""
 
     _instance = None
     _config = None
+    _mtime_ns = None
 
     def __new__(cls):
         if cls._instance is None:
@@ -44,39 +88,106 @@ class Config:
         return cls._instance
 
     def _load_config(self):
-        """Load configuration from YAML file"""
-        config_path = CONFIG_DIR / "settings.yaml"
+        """Load configuration from YAML file, then apply tool-written overrides"""
+        config_path = SETTINGS_FILE
+        # Resolved dotted keys; rebuilt lazily after every (re)load
+        self._cache = {}
+        self._mtime_ns = None
         try:
             with open(config_path, 'r') as f:
-                self._config = yaml.safe_load(f)
+                mtime_ns = os.fstat(f.fileno()).st_mtime_ns
+                self._config = yaml.load(f, Loader=YamlLoader) or {}
             logging.info(f"Configuration loaded from {config_path}")
         except FileNotFoundError:
             logging.error(f"Configuration file not found: {config_path}")
             self._config = {}
+            return
         except yaml.YAMLError as e:
             logging.error(f"Error parsing configuration: {e}")
             self._config = {}
+            return
+
+        override_mtime_ns = _file_mtime_ns(SETTINGS_OVERRIDE_FILE)
+        if override_mtime_ns is not None:
+            try:
+                with open(SETTINGS_OVERRIDE_FILE, 'r') as f:
+                    merge_settings(self._config, json.load(f))
+                logging.info(f"Configuration overrides applied from {SETTINGS_OVERRIDE_FILE}")
+            except (OSError, ValueError) as e:
+                logging.error(f"Error reading configuration overrides: {e}")
+
+        self._mtime_ns = (mtime_ns, override_mtime_ns)
 
     def get(self, key_path: str, default: Any = None) -> Any:
         """
         Get configuration value using dot notation
         Example: config.get('camera.resolution_width', 640)
         """
-        keys = key_path.split('.')
+        try:
+            value = self._cache[key_path]
+        except KeyError:
+            value = self._lookup(key_path)
+            self._cache[key_path] = value
+
+        return value if value is not None else default
+
+    def _lookup(self, key_path: str) -> Any:
+        """Resolve a dotted key path, returning None if any part is missing"""
         value = self._config
 
-        for key in keys:
+        for key in key_path.split('.'):
             if isinstance(value, dict):
                 value = value.get(key)
             else:
-                return default
+                return None
 
-        return value if value is not None else default
+        return value
+
+    def reload(self, force: bool = False):
+        """
+        Reload configuration from file
+
+        Args:
+            force: Re-parse even if the file is unchanged since the last load
+        """
+        if not force and self._mtime_ns is not None:
+            current = (_file_mtime_ns(SETTINGS_FILE), _file_mtime_ns(SETTINGS_OVERRIDE_FILE))
+            if current == self._mtime_ns:
+                return
 
-    def reload(self):
-        """Reload configuration from file"""
         self._load_config()
 
+    def save_overrides(self, updates: Dict[str, Any]):
+        """
+        Persist tool-determined settings without rewriting settings.yaml
+
+        Values are merged into settings.override.json, which is applied on
+        top of settings.yaml at load time, then the configuration is reloaded.
+        Example: config.save_overrides({'camera.gamma': 1.2})
+
+        Args:
+            updates: Mapping of dotted key paths to values
+        """
+        overrides = {}
+        if SETTINGS_OVERRIDE_FILE.exists():
+            with open(SETTINGS_OVERRIDE_FILE, 'r') as f:
+                overrides = json.load(f)
+
+        for key_path, value in updates.items():
+            *sections, leaf = key_path.split('.')
+            node = overrides
+            for section in sections:
+                node = node.setdefault(section, {})
+            node[leaf] = value
+
+        # Write-then-rename so a crash never leaves a truncated file behind
+        tmp_path = SETTINGS_OVERRIDE_FILE.with_suffix('.json.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(overrides, f, indent=2)
+        os.replace(tmp_path, SETTINGS_OVERRIDE_FILE)
+
+        self.reload(force=True)
+
 
 def setup_logging(log_level: str = "INFO", log_file: Optional[str] = None) -> logging.Logger:
     """
@@ -146,6 +257,73 @@ def get_system_info() -> Dict[str, Any]:
     return info
 
 
+def read_cpu_temperature() -> Optional[float]:
+    """
+    Read the SoC temperature from the kernel thermal zone
+
+    Returns:
+        Temperature in degrees Celsius, or None if unavailable
+    """
+    try:
+        with open('/sys/class/thermal/thermal_zone0/temp', 'r') as f:
+            return int(f.read().strip()) / 1000.0
+    except (OSError, ValueError):
+        return None
+
+
+def set_thread_scheduling(cpus: Optional[Set[int]] = None,
+                          realtime_priority: Optional[int] = None,
+                          nice: Optional[int] = None,
+                          normal_policy: bool = False) -> bool:
+    """
+    Apply CPU affinity and scheduling policy to the calling thread (Linux)
+
+    Args:
+        cpus: CPU cores to pin the thread to (cores not present are ignored)
+        realtime_priority: SCHED_FIFO priority (requires CAP_SYS_NICE or RLIMIT_RTPRIO)
+        nice: Nice value (negative values require CAP_SYS_NICE or RLIMIT_NICE)
+        normal_policy: Switch to SCHED_OTHER; threads inherit the policy of the
+            thread that created them, so workers spawned by a SCHED_FIFO thread
+            would otherwise run real-time too
+
+    Returns:
+        True if every requested setting was applied
+    """
+    applied = True
+
+    if cpus and hasattr(os, 'sched_setaffinity'):
+        cores = set(cpus) & os.sched_getaffinity(0)
+        try:
+            if not cores:
+                raise OSError(f"none of cores {sorted(cpus)} available")
+            os.sched_setaffinity(0, cores)
+        except OSError as e:
+            logging.debug(f"Could not set CPU affinity: {e}")
+            applied = False
+
+    if realtime_priority and hasattr(os, 'sched_setscheduler'):
+        try:
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(realtime_priority))
+        except OSError as e:
+            logging.debug(f"Could not set SCHED_FIFO priority {realtime_priority}: {e}")
+            applied = False
+    elif normal_policy and hasattr(os, 'sched_setscheduler'):
+        try:
+            os.sched_setscheduler(0, os.SCHED_OTHER, os.sched_param(0))
+        except OSError as e:
+            logging.debug(f"Could not reset scheduling policy: {e}")
+            applied = False
+
+    if nice is not None and hasattr(os, 'setpriority'):
+        try:
+            os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), nice)
+        except OSError as e:
+            logging.debug(f"Could not set nice {nice}: {e}")
+            applied = False
+
+    return applied
+
+
 def check_storage_space(threshold_gb: float = 5.0) -> Tuple[bool, float]:
     """
     Check available storage space
@@ -192,6 +370,26 @@ def check_raspberry_pi5() -> bool:
     return False
 
 
+def get_opencv_cpu_features() -> Dict[str, str]:
+    """
+    Get the CPU optimizations OpenCV was compiled with
+
+    Returns:
+        Dictionary with 'baseline' and 'dispatched' instruction sets
+        (empty strings if not reported by the build)
+    """
+    features = {'baseline': '', 'dispatched': ''}
+
+    for line in cv2.getBuildInformation().splitlines():
+        key, _, value = line.strip().partition(':')
+        if key == 'Baseline':
+            features['baseline'] = value.strip()
+        elif key == 'Dispatched code generation':
+            features['dispatched'] = value.strip()
+
+    return features
+
+
 def preprocess_image(image: np.ndarray, target_size: Optional[Tuple[int, int]] = None,
                      enhance: bool = True) -> np.ndarray:
     """
@@ -220,6 +418,310 @@ def preprocess_image(image: np.ndarray, target_size: Optional[Tuple[int, int]] =
     return image
 
 
+class FramePreprocessor:
+    """
+    Derive the model inputs several detectors need from one frame
+
+    Each input is computed at most once per call and written into a buffer
+    that is reused on the next call, so results must be consumed before the
+    same key is requested again.
+
+    Keys:
+        'gray': Full-resolution grayscale frame
+        'rgb': Full-resolution RGB frame
+        'object_input': RGB frame resized to the object detector input size
+    """
+
+    def __init__(self, object_input_size: Optional[Tuple[int, int]] = None):
+        """
+        Args:
+            object_input_size: Object detector input size (width, height)
+        """
+        self.object_input_size = object_input_size
+        self._buffers: Dict[str, np.ndarray] = {}
+
+    def __call__(self, frame: np.ndarray, needs: Iterable[str]) -> Dict[str, np.ndarray]:
+        """
+        Preprocess frame for the requested inputs
+
+        Args:
+            frame: Input frame (BGR format)
+            needs: Keys of the inputs required this tick
+
+        Returns:
+            Dictionary mapping each requested key to its array
+        """
+        needs = set(needs)
+        buffers = self._buffers
+        inputs = {}
+
+        if 'gray' in needs:
+            buffers['gray'] = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=buffers.get('gray'))
+            inputs['gray'] = buffers['gray']
+
+        if 'rgb' in needs:
+            buffers['rgb'] = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=buffers.get('rgb'))
+            inputs['rgb'] = buffers['rgb']
+
+        if 'object_input' in needs and self.object_input_size:
+            if 'rgb' in inputs:
+                # Reuse the full-size conversion
+                buffers['object_input'] = cv2.resize(
+                    inputs['rgb'], self.object_input_size, dst=buffers.get('object_input')
+                )
+            else:
+                # Resize first so the color conversion runs on the small image
+                buffers['object_bgr'] = cv2.resize(
+                    frame, self.object_input_size, dst=buffers.get('object_bgr')
+                )
+                buffers['object_input'] = cv2.cvtColor(
+                    buffers['object_bgr'], cv2.COLOR_BGR2RGB, dst=buffers.get('object_input')
+                )
+            inputs['object_input'] = buffers['object_input']
+
+        return inputs
+
+
+class SceneChangeDetector:
+    """
+    Cheap scene-change test on tiny grayscale thumbnails
+
+    Each caller key keeps the thumbnail of the frame it last processed, so
+    slow changes accumulate until they cross the threshold.
+    """
+
+    def __init__(self, threshold: float = 4.0, size: Tuple[int, int] = (64, 64)):
+        """
+        Args:
+            threshold: Mean absolute gray-level difference (0-255) that counts as a change
+            size: Thumbnail size (width, height)
+        """
+        self.threshold = threshold
+        self.size = size
+        self._references: Dict[str, np.ndarray] = {}
+
+    def thumbnail(self, frame: np.ndarray) -> np.ndarray:
+        """
+        Downsample a BGR frame to a grayscale thumbnail
+
+        Args:
+            frame: Input frame (BGR format)
+
+        Returns:
+            Grayscale thumbnail
+        """
+        small = cv2.resize(frame, self.size, interpolation=cv2.INTER_AREA)
+        return cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+
+    def changed(self, key: str, thumbnail: np.ndarray) -> bool:
+        """
+        Check whether thumbnail differs from the one last marked for key
+
+        Args:
+            key: Caller identifier
+            thumbnail: Thumbnail from thumbnail()
+
+        Returns:
+            True if changed, or if key has no reference yet
+        """
+        reference = self._references.get(key)
+        if reference is None:
+            return True
+
+        difference = cv2.norm(thumbnail, reference, cv2.NORM_L1) / thumbnail.size
+        return difference > self.threshold
+
+    def mark(self, key: str, thumbnail: np.ndarray):
+        """Record thumbnail as the reference for key"""
+        self._references[key] = thumbnail
+
+
+class PerceptualHashCache:
+    """
+    LRU cache of results keyed by a difference hash (dHash) of the frame
+
+    Frames whose hashes differ in at most max_distance bits count as the
+    same scene, so an expensive analysis of a view the camera is still
+    pointed at is answered from memory. Entries expire after ttl seconds.
+    """
+
+    def __init__(self, capacity: int = 16, max_distance: int = 4,
+                 hash_size: int = 16, ttl: float = 60.0):
+        """
+        Args:
+            capacity: Maximum number of cached results
+            max_distance: Maximum Hamming distance between hashes for a hit
+            hash_size: Hash grid side; the hash has hash_size**2 bits
+            ttl: Seconds before an entry is considered stale
+        """
+        self.capacity = capacity
+        self.max_distance = max_distance
+        self.hash_size = hash_size
+        self.ttl = ttl
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def hash(self, frame: np.ndarray) -> int:
+        """
+        Compute the dHash of a frame
+
+        Args:
+            frame: BGR or grayscale frame
+
+        Returns:
+            hash_size**2-bit integer; bit set where a pixel is brighter than its left neighbour
+        """
+        gray = frame if frame.ndim == 2 else cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        # Average in float: rounding the thumbnail to uint8 creates ties across
+        # evenly lit paper, and sensor noise then flips those bits at random
+        small = cv2.resize(gray.astype(np.float32), (self.hash_size + 1, self.hash_size),
+                           interpolation=cv2.INTER_AREA)
+        bits = small[:, 1:] > small[:, :-1]
+        return int.from_bytes(np.packbits(bits).tobytes(), 'big')
+
+    def get(self, frame_hash: int) -> Any:
+        """
+        Look up a result for a hash, or a near-identical one
+
+        Args:
+            frame_hash: Hash from hash()
+
+        Returns:
+            Cached result, or None on a miss
+        """
+        now = time.time()
+        with self._lock:
+            key = frame_hash if frame_hash in self._entries else None
+            if key is None:
+                for candidate in self._entries:
+                    if (candidate ^ frame_hash).bit_count() <= self.max_distance:
+                        key = candidate
+                        break
+
+            if key is None:
+                return None
+
+            stored_at, value = self._entries[key]
+            if now - stored_at > self.ttl:
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, frame_hash: int, value: Any):
+        """Store a result, evicting the least recently used entry when full"""
+        if self.capacity <= 0:
+            return
+
+        with self._lock:
+            self._entries[frame_hash] = (time.time(), value)
+            self._entries.move_to_end(frame_hash)
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop all cached results"""
+        with self._lock:
+            self._entries.clear()
+
+
+class SharedFrameRing:
+    """
+    Ring of fixed-size frames in POSIX shared memory
+
+    Lets another process read camera frames by (slot, sequence) without
+    copying them through a pipe. Layout: one int64 sequence number per
+    slot, followed by the frame slots. A slot's sequence is 0 while it is
+    being written, so readers must check is_current() after using a view.
+    """
+
+    def __init__(self, shape: Tuple[int, ...], num_slots: int = 4,
+                 name: Optional[str] = None):
+        """
+        Args:
+            shape: Frame shape, e.g. (height, width, 3)
+            num_slots: Number of frames kept
+            name: Existing shared memory block to attach to (None = create)
+        """
+        self.shape = tuple(shape)
+        self.num_slots = num_slots
+        frame_size = int(np.prod(self.shape))
+        header_size = num_slots * 8
+
+        self.owner = name is None
+        if self.owner:
+            self._shm = shared_memory.SharedMemory(create=True, size=header_size + num_slots * frame_size)
+        elif sys.version_info >= (3, 13):
+            self._shm = shared_memory.SharedMemory(name=name, track=False)
+        else:
+            # Before 3.13 attaching registers the block with this process's
+            # resource tracker, which unlinks it when the reader exits (bpo-39959)
+            self._shm = shared_memory.SharedMemory(name=name)
+            if os.name == 'posix':
+                resource_tracker.unregister(self._shm._name, 'shared_memory')
+        self.name = self._shm.name
+
+        self._sequences = np.ndarray((num_slots,), dtype=np.int64, buffer=self._shm.buf)
+        self._frames = np.ndarray(
+            (num_slots,) + self.shape, dtype=np.uint8, buffer=self._shm.buf, offset=header_size
+        )
+        if self.owner:
+            self._sequences[:] = 0
+        self._next_sequence = 1
+
+    def write(self, frame: np.ndarray) -> Tuple[int, int]:
+        """
+        Copy a frame into the next slot
+
+        Args:
+            frame: Frame with the ring's shape
+
+        Returns:
+            Tuple of (sequence number, slot)
+        """
+        sequence = self._next_sequence
+        slot = sequence % self.num_slots
+
+        self._sequences[slot] = 0
+        np.copyto(self._frames[slot], frame)
+        self._sequences[slot] = sequence
+
+        self._next_sequence += 1
+        return sequence, slot
+
+    def read(self, slot: int, sequence: int) -> Optional[np.ndarray]:
+        """
+        Get a read-only view of a slot if it still holds the given frame
+
+        Args:
+            slot: Slot index
+            sequence: Expected sequence number
+
+        Returns:
+            Frame view, or None if the slot has been overwritten
+        """
+        if not self.is_current(slot, sequence):
+            return None
+
+        view = self._frames[slot]
+        view.flags.writeable = False
+        return view
+
+    def is_current(self, slot: int, sequence: int) -> bool:
+        """Check whether a slot still holds the given frame"""
+        return int(self._sequences[slot]) == sequence
+
+    def close(self):
+        """Detach from the shared memory, unlinking it if this ring created it"""
+        # Drop views before closing the underlying buffer
+        self._sequences = None
+        self._frames = None
+        self._shm.close()
+        if self.owner:
+            self._shm.unlink()
+
+
 def calculate_distance_from_width(known_width_cm: float, focal_length: float,
                                    perceived_width_px: int, image_width_px: int) -> float:
     """
@@ -4,7 +4,11 @@ Handles voice commands and speech recognition
 Optimized for Raspberry Pi 5
 """
 
+import json
 import logging
+import os
+import re
+import struct
 import threading
 import time
 from typing import Optional, Callable, Dict
@@ -16,6 +20,18 @@ except ImportError:
     SR_AVAILABLE = False
     logging.warning("speech_recognition not available")
 
+try:
+    from vosk import Model, KaldiRecognizer, SetLogLevel
+    VOSK_AVAILABLE = True
+except ImportError:
+    VOSK_AVAILABLE = False
+
+try:
+    import pvporcupine
+    PORCUPINE_AVAILABLE = True
+except ImportError:
+    PORCUPINE_AVAILABLE = False
+
 from utils import Config
 
 
@@ -37,14 +53,24 @@ class VoiceAssistant:
         self.timeout = config.get('voice_assistant.timeout_seconds', 5)
         self.ambient_noise_duration = config.get('voice_assistant.ambient_noise_duration', 1)
         self.energy_threshold = config.get('voice_assistant.energy_threshold', 4000)
+        self.wake_word_engine = config.get('voice_assistant.wake_word_engine', 'stt')
 
         # Speech recognizer
         self.recognizer = None
         self.microphone = None
 
+        # On-device wake word detector (None = spot the wake word in STT text)
+        self._porcupine = None
+
+        # On-device command recognizer (None = Google Speech Recognition)
+        self._vosk_model = None
+        self._kaldi = None
+
         # Listening state
         self.is_listening = False
         self.listen_thread = None
+        self._source = None  # Microphone held open by the listen loop
+        self._stop_background = None  # Stopper returned by listen_in_background()
 
         # Command callbacks
         self.command_callbacks = {}
@@ -62,6 +88,8 @@ class VoiceAssistant:
             'exit': 'exit_app',
             'repeat': 'repeat_last',
         }
+        self._cmd_regex = None
+        self._compile_commands()
 
     def initialize(self) -> bool:
         """
@@ -81,9 +109,21 @@ class VoiceAssistant:
             self.recognizer = sr.Recognizer()
             self.recognizer.energy_threshold = self.energy_threshold
 
+            if self.wake_word_engine == 'porcupine':
+                self._porcupine = self._create_porcupine()
+
+            self._load_vosk_model()
+
             # Initialize microphone
             try:
-                self.microphone = sr.Microphone()
+                if self._porcupine is not None:
+                    # Porcupine consumes fixed-size 16 kHz frames straight off the stream
+                    self.microphone = sr.Microphone(
+                        sample_rate=self._porcupine.sample_rate,
+                        chunk_size=self._porcupine.frame_length
+                    )
+                else:
+                    self.microphone = sr.Microphone()
             except Exception as mic_error:
                 self.logger.error(f"No microphone found: {mic_error}")
                 self.logger.info("Voice commands will not be available")
@@ -106,6 +146,53 @@ class VoiceAssistant:
             self.enabled = False
             return False
 
+    def _load_vosk_model(self):
+        """Load the offline Vosk model if configured, restricted to the command grammar"""
+        model_path = self.config.get('voice_assistant.vosk_model_path', '')
+        if not model_path:
+            return
+
+        if not VOSK_AVAILABLE:
+            self.logger.warning("vosk not available, using Google Speech Recognition")
+            return
+
+        if not os.path.isdir(model_path):
+            self.logger.warning(f"Vosk model not found at {model_path}, using Google Speech Recognition")
+            return
+
+        try:
+            SetLogLevel(-1)
+            self._vosk_model = Model(model_path)
+            self._compile_commands()
+            self.logger.info(f"Offline command recognition enabled ({model_path})")
+        except Exception as e:
+            self.logger.warning(f"Could not load Vosk model, using Google Speech Recognition: {e}")
+            self._vosk_model = None
+            self._kaldi = None
+
+    def _create_porcupine(self):
+        """
+        Create the Porcupine wake word engine
+
+        Returns:
+            Porcupine handle, or None to fall back to speech-to-text wake word spotting
+        """
+        if not PORCUPINE_AVAILABLE:
+            self.logger.warning("pvporcupine not available, spotting wake word via speech recognition")
+            return None
+
+        try:
+            keyword = self.config.get('voice_assistant.porcupine_keyword', 'jarvis')
+            porcupine = pvporcupine.create(
+                access_key=self.config.get('voice_assistant.porcupine_access_key', ''),
+                keywords=[keyword]
+            )
+            self.logger.info(f"On-device wake word enabled (keyword: '{keyword}')")
+            return porcupine
+        except Exception as e:
+            self.logger.warning(f"Could not start Porcupine, spotting wake word via speech recognition: {e}")
+            return None
+
     def start_listening(self):
         """Start listening for voice commands in background"""
         if not self.enabled or self.is_listening:
@@ -117,44 +204,108 @@ class VoiceAssistant:
             return
 
         self.is_listening = True
-        self.listen_thread = threading.Thread(target=self._listen_loop, daemon=True)
-        self.listen_thread.start()
+
+        if self._porcupine is None:
+            # SpeechRecognition keeps the stream open and hands us each phrase
+            self._stop_background = self.recognizer.listen_in_background(
+                self.microphone, self._on_audio, phrase_time_limit=5
+            )
+        else:
+            self.listen_thread = threading.Thread(target=self._listen_loop, daemon=True)
+            self.listen_thread.start()
+
         self.logger.info("Started listening for voice commands")
 
     def stop_listening(self):
         """Stop listening for voice commands"""
         self.is_listening = False
+        if self._stop_background:
+            self._stop_background(wait_for_stop=False)
+            self._stop_background = None
         if self.listen_thread:
             self.listen_thread.join(timeout=2)
         self.logger.info("Stopped listening")
 
+    def _on_audio(self, recognizer, audio):
+        """
+        Handle one phrase captured by the background listener
+
+        Args:
+            recognizer: Recognizer that captured the phrase
+            audio: Captured audio
+        """
+        try:
+            command = self._recognize(audio)
+            if not command:
+                return
+
+            self.logger.info(f"Heard command: {command}")
+
+            command_lower = command.lower()
+            wake_word = self.wake_word.lower()
+
+            # Check if it's a wake word
+            if wake_word in command_lower:
+                self._execute_callback('wake_word_detected')
+
+                # A command in the same breath runs now; otherwise the next phrase is the command
+                remainder = command[command_lower.index(wake_word) + len(wake_word):].strip()
+                if remainder:
+                    self._process_command(remainder)
+            else:
+                # Direct command without wake word
+                self._process_command(command)
+
+        except Exception as e:
+            self.logger.error(f"Error handling voice input: {e}")
+
     def _listen_loop(self):
-        """Main listening loop"""
+        """Porcupine listening loop; the microphone stream stays open between phrases"""
         while self.is_listening:
             try:
-                # Listen for wake word
-                command = self._listen_for_command()
-
-                if command:
-                    self.logger.info(f"Heard command: {command}")
-
-                    # Check if it's a wake word
-                    if self.wake_word.lower() in command.lower():
-                        self._execute_callback('wake_word_detected')
+                with self.microphone as source:
+                    self._source = source
+                    self._listen_phrases()
+            except Exception as e:
+                self.logger.error(f"Microphone error, reopening: {e}")
+                time.sleep(1)
+            finally:
+                self._source = None
 
-                        # Listen for actual command
-                        time.sleep(0.5)
-                        actual_command = self._listen_for_command()
+    def _listen_phrases(self):
+        """Listen and dispatch phrases until stopped or the stream needs reopening"""
+        while self.is_listening:
+            try:
+                # Only go to the speech recognizer once the wake word is heard locally
+                if self._wait_for_wake_word():
+                    self._execute_callback('wake_word_detected')
+                    command = self._listen_for_command()
 
-                        if actual_command:
-                            self._process_command(actual_command)
-                    else:
-                        # Direct command without wake word
+                    if command:
                         self._process_command(command)
 
             except Exception as e:
                 self.logger.error(f"Error in listen loop: {e}")
                 time.sleep(1)
+                return
+
+    def _wait_for_wake_word(self) -> bool:
+        """
+        Feed raw microphone frames to Porcupine until the wake word is heard
+
+        Returns:
+            True if the wake word was detected, False if listening stopped
+        """
+        frame_length = self._porcupine.frame_length
+        fmt = f'{frame_length}h'
+
+        stream = self._source.stream
+        while self.is_listening:
+            data = stream.read(frame_length)
+            if self._porcupine.process(struct.unpack_from(fmt, data)) >= 0:
+                return True
+
+        return False
 
     def _listen_for_command(self) -> Optional[str]:
         """
@@ -169,20 +320,14 @@ class VoiceAssistant:
             return None
 
         try:
-            with self.microphone as source:
-                # Listen
-                audio = self.recognizer.listen(source, timeout=self.timeout, phrase_time_limit=5)
+            # Listen, on the listen loop's open stream when there is one
+            if self._source is not None:
+                audio = self.recognizer.listen(self._source, timeout=self.timeout, phrase_time_limit=5)
+            else:
+                with self.microphone as source:
+                    audio = self.recognizer.listen(source, timeout=self.timeout, phrase_time_limit=5)
 
-            # Recognize speech using Google Speech Recognition
-            try:
-                text = self.recognizer.recognize_google(audio)
-                return text
-            except sr.UnknownValueError:
-                self.logger.debug("Could not understand audio")
-                return None
-            except sr.RequestError as e:
-                self.logger.error(f"Speech recognition error: {e}")
-                return None
+            return self._recognize(audio)
 
         except sr.WaitTimeoutError:
             return None
@@ -190,6 +335,33 @@ class VoiceAssistant:
             self.logger.error(f"Error listening: {e}")
             return None
 
+    def _recognize(self, audio) -> Optional[str]:
+        """
+        Convert captured audio to text
+
+        Args:
+            audio: Captured audio
+
+        Returns:
+            Recognized text or None
+        """
+        if self._kaldi is not None:
+            # Decode on-device against the command grammar
+            self._kaldi.AcceptWaveform(audio.get_raw_data(convert_rate=16000, convert_width=2))
+            text = json.loads(self._kaldi.FinalResult()).get('text', '')
+            text = text.replace('[unk]', '').strip()
+            return text or None
+
+        # Recognize speech using Google Speech Recognition
+        try:
+            return self.recognizer.recognize_google(audio)
+        except sr.UnknownValueError:
+            self.logger.debug("Could not understand audio")
+            return None
+        except sr.RequestError as e:
+            self.logger.error(f"Speech recognition error: {e}")
+            return None
+
     def _process_command(self, command: str):
         """
         Process recognized command
@@ -197,14 +369,13 @@ class VoiceAssistant:
         Args:
             command: Command text
         """
-        command_lower = command.lower()
-
-        # Find matching command
-        for keyword, action in self.commands.items():
-            if keyword in command_lower:
-                self.logger.info(f"Executing action: {action}")
-                self._execute_callback(action, command)
-                return
+        # Find matching command in a single scan
+        match = self._cmd_regex.search(command)
+        if match:
+            action = self.commands[match.group(1).lower()]
+            self.logger.info(f"Executing action: {action}")
+            self._execute_callback(action, command)
+            return
 
         # No matching command
         self.logger.warning(f"Unknown command: {command}")
@@ -258,8 +429,19 @@ class VoiceAssistant:
             action: Action identifier
         """
         self.commands[keyword.lower()] = action
+        self._compile_commands()
         self.logger.info(f"Added command: {keyword} -> {action}")
 
+    def _compile_commands(self):
+        """Build one case-insensitive alternation over all command keywords"""
+        pattern = '|'.join(re.escape(keyword) for keyword in self.commands)
+        self._cmd_regex = re.compile(f'({pattern})', re.IGNORECASE)
+
+        if self._vosk_model is not None:
+            # Only the wake word and command phrases can be recognized; anything else is [unk]
+            grammar = [self.wake_word.lower()] + list(self.commands) + ['[unk]']
+            self._kaldi = KaldiRecognizer(self._vosk_model, 16000, json.dumps(grammar))
+
 
 def test_voice_assistant():
     """Test voice assistant"""
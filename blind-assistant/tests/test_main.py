@@ -0,0 +1,66 @@
+"""
+Unit tests for voice command handling in the main application
+"""
+
+import unittest
+import sys
+from pathlib import Path
+from unittest import mock
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+try:
+    from main import VisionGuardian
+    MAIN_AVAILABLE = True
+except ImportError:
+    # Runtime dependencies (pyttsx3, ...) not installed
+    MAIN_AVAILABLE = False
+
+
+@unittest.skipUnless(MAIN_AVAILABLE, "application dependencies not installed")
+class TestDeferredModuleCommands(unittest.TestCase):
+    """Test voice commands issued while deferred modules are loading"""
+
+    def _app(self, ocr_enabled=True):
+        # Bypass __init__ (config, logging, storage checks); set only what commands use
+        app = VisionGuardian.__new__(VisionGuardian)
+        app.logger = mock.Mock()
+        app.audio = mock.Mock()
+        app.camera = mock.Mock()
+        app.ocr = None
+        app.features_enabled = {'ocr': ocr_enabled}
+        return app
+
+    def test_command_while_loading_announces(self):
+        """Test that a command for a module still loading says so"""
+        app = self._app()
+
+        app._cmd_read_text()
+
+        app.audio.announce.assert_called_once()
+        self.assertIn("still loading", app.audio.announce.call_args[0][0])
+        app.camera.get_current_frame.assert_not_called()
+
+    def test_command_for_disabled_module_announces(self):
+        """Test that a command for a disabled module says it is unavailable"""
+        app = self._app(ocr_enabled=False)
+
+        app._cmd_read_text()
+
+        self.assertIn("not available", app.audio.announce.call_args[0][0])
+
+    def test_command_runs_once_loaded(self):
+        """Test that a loaded module handles the command"""
+        app = self._app()
+        app.ocr = mock.Mock()
+        app.ocr.format_for_announcement.return_value = "Exit"
+
+        app._cmd_read_text()
+
+        app.ocr.read_text.assert_called_once()
+        app.audio.read_text.assert_called_once_with("Exit")
+
+
+if __name__ == '__main__':
+    unittest.main()
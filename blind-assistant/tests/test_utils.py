@@ -3,9 +3,17 @@ Unit tests for utility functions
 """
 
 import unittest
+import os
+import subprocess
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 
+import cv2
+import numpy as np
+
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
@@ -13,8 +21,16 @@ from utils import (
     Config,
     get_system_info,
     check_storage_space,
+    merge_settings,
+    get_opencv_cpu_features,
+    read_cpu_temperature,
+    set_thread_scheduling,
     calculate_distance_from_width,
-    PerformanceMonitor
+    PerformanceMonitor,
+    FramePreprocessor,
+    SceneChangeDetector,
+    PerceptualHashCache,
+    SharedFrameRing
 )
 
 
@@ -39,6 +55,11 @@ class TestConfig(unittest.TestCase):
         fps = config.get('camera.fps', 15)
         self.assertIsInstance(fps, int)
 
+        # Cached lookups still honour each call's default
+        self.assertEqual(config.get('nonexistent.key', 'other'), 'other')
+        self.assertEqual(config.get('camera.fps', 15), fps)
+        self.assertEqual(config.get('camera.fps.deeper', 'leaf'), 'leaf')
+
     def test_config_reload(self):
         """Test configuration reload"""
         config = Config()
@@ -46,6 +67,28 @@ class TestConfig(unittest.TestCase):
         # Should not raise exception
         self.assertIsNotNone(config._config)
 
+    def test_config_reload_unchanged(self):
+        """Test that reload skips parsing an unchanged file"""
+        config = Config()
+        config.reload(force=True)
+        parsed = config._config
+
+        config.reload()
+        self.assertIs(config._config, parsed)
+
+        config.reload(force=True)
+        self.assertIsNot(config._config, parsed)
+
+    def test_merge_settings(self):
+        """Test that overrides replace only the leaves they name"""
+        base = {'camera': {'fps': 15, 'gamma': 1.0}, 'audio': {'volume': 80}}
+        merged = merge_settings(base, {'camera': {'gamma': 1.4}, 'extra': {'a': 1}})
+
+        self.assertIs(merged, base)
+        self.assertEqual(base['camera'], {'fps': 15, 'gamma': 1.4})
+        self.assertEqual(base['audio'], {'volume': 80})
+        self.assertEqual(base['extra'], {'a': 1})
+
 
 class TestSystemInfo(unittest.TestCase):
     """Test system information functions"""
@@ -76,6 +119,68 @@ class TestSystemInfo(unittest.TestCase):
         self.assertIsInstance(free_gb, float)
         self.assertGreater(free_gb, 0)
 
+    def test_read_cpu_temperature(self):
+        """Test CPU temperature read (may be unavailable off-device)"""
+        temperature = read_cpu_temperature()
+
+        if temperature is not None:
+            self.assertIsInstance(temperature, float)
+            self.assertGreater(temperature, -50)
+            self.assertLess(temperature, 150)
+
+    @unittest.skipUnless(hasattr(os, 'sched_setaffinity'), "Linux only")
+    def test_set_thread_scheduling_affinity(self):
+        """Test pinning a thread to its current cores"""
+        cores = os.sched_getaffinity(0)
+        results = []
+
+        thread = threading.Thread(
+            target=lambda: results.append((set_thread_scheduling(cpus=cores | {4096}),
+                                           os.sched_getaffinity(0)))
+        )
+        thread.start()
+        thread.join()
+
+        self.assertTrue(results[0][0])
+        self.assertEqual(results[0][1], cores)
+
+    @unittest.skipUnless(hasattr(os, 'sched_setscheduler'), "Linux only")
+    def test_set_thread_scheduling_pool_from_realtime_thread(self):
+        """Test pool workers spawned by a SCHED_FIFO thread drop back to SCHED_OTHER"""
+        results = []
+
+        def realtime_parent():
+            try:
+                os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(20))
+            except OSError:
+                return
+
+            # Same construction as the detector pool in main.py
+            with ThreadPoolExecutor(
+                max_workers=1,
+                initializer=partial(set_thread_scheduling,
+                                    cpus=os.sched_getaffinity(0), normal_policy=True)
+            ) as pool:
+                results.append(pool.submit(
+                    lambda: (os.sched_getscheduler(0), os.sched_getparam(0).sched_priority)
+                ).result())
+
+        thread = threading.Thread(target=realtime_parent)
+        thread.start()
+        thread.join()
+
+        if not results:
+            self.skipTest("SCHED_FIFO not permitted")
+        self.assertEqual(results[0], (os.SCHED_OTHER, 0))
+
+    def test_get_opencv_cpu_features(self):
+        """Test OpenCV build feature parsing"""
+        features = get_opencv_cpu_features()
+
+        self.assertIn('baseline', features)
+        self.assertIn('dispatched', features)
+        self.assertIsInstance(features['baseline'], str)
+
 
 class TestDistanceCalculation(unittest.TestCase):
     """Test distance calculation"""
@@ -148,6 +253,163 @@ class TestPerformanceMonitor(unittest.TestCase):
         self.assertIsNone(stats)
 
 
+class TestFramePreprocessor(unittest.TestCase):
+    """Test shared frame preprocessing"""
+
+    def setUp(self):
+        self.frame = np.random.randint(0, 256, (120, 160, 3), dtype=np.uint8)
+
+    def test_requested_inputs_only(self):
+        """Test only requested keys are produced"""
+        preprocessor = FramePreprocessor(object_input_size=(32, 24))
+        inputs = preprocessor(self.frame, {'gray'})
+
+        self.assertEqual(set(inputs), {'gray'})
+        np.testing.assert_array_equal(
+            inputs['gray'], cv2.cvtColor(self.frame, cv2.COLOR_BGR2GRAY)
+        )
+
+    def test_object_input(self):
+        """Test object input matches resize + BGR->RGB, with or without full RGB"""
+        preprocessor = FramePreprocessor(object_input_size=(32, 24))
+
+        alone = preprocessor(self.frame, {'object_input'})['object_input'].copy()
+        inputs = preprocessor(self.frame, {'rgb', 'object_input'})
+
+        self.assertEqual(alone.shape, (24, 32, 3))
+        self.assertEqual(inputs['object_input'].shape, (24, 32, 3))
+        np.testing.assert_array_equal(
+            inputs['rgb'], cv2.cvtColor(self.frame, cv2.COLOR_BGR2RGB)
+        )
+
+    def test_buffers_reused(self):
+        """Test output buffers are reused between calls"""
+        preprocessor = FramePreprocessor()
+        first = preprocessor(self.frame, {'gray'})['gray']
+        second = preprocessor(self.frame, {'gray'})['gray']
+
+        self.assertIs(first, second)
+
+
+class TestSceneChangeDetector(unittest.TestCase):
+    """Test thumbnail-based scene change detection"""
+
+    def test_scene_change(self):
+        """Test unchanged, slightly noisy and changed frames"""
+        detector = SceneChangeDetector(threshold=4.0)
+        frame = np.full((240, 320, 3), 100, dtype=np.uint8)
+        thumbnail = detector.thumbnail(frame)
+
+        self.assertEqual(thumbnail.shape, (64, 64))
+        self.assertTrue(detector.changed('face', thumbnail))
+
+        detector.mark('face', thumbnail)
+        self.assertFalse(detector.changed('face', detector.thumbnail(frame + 2)))
+        self.assertTrue(detector.changed('face', detector.thumbnail(frame + 40)))
+
+        # References are kept per key
+        self.assertTrue(detector.changed('object', thumbnail))
+
+
+class TestPerceptualHashCache(unittest.TestCase):
+    """Test the perceptual-hash result cache"""
+
+    @staticmethod
+    def _page(lines, seed=None):
+        """Synthetic camera view of a printed page: uneven lighting, dark text, sensor noise"""
+        yy, xx = np.mgrid[0:240, 0:320]
+        light = 150 + 60 * np.sin(xx / 320 * np.pi) * np.sin(yy / 240 * np.pi) + xx * 0.1
+        page = cv2.cvtColor(light.astype(np.uint8), cv2.COLOR_GRAY2BGR)
+        for i, text in enumerate(lines):
+            cv2.putText(page, text, (10, 30 + i * 35), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (20, 20, 20), 2)
+        if seed is not None:
+            noise = np.random.default_rng(seed).normal(0, 3, page.shape)
+            page = np.clip(page + noise, 0, 255).astype(np.uint8)
+        return page
+
+    def test_similar_frames_hit(self):
+        """Test that a noisy re-capture of the same page hits within max_distance"""
+        cache = PerceptualHashCache(capacity=2)
+        lines = ["EXIT ONLY", "Platform 4", "Trains to", "Central"]
+        frame_hash = cache.hash(self._page(lines, seed=0))
+        cache.put(frame_hash, 'page one')
+
+        for seed in range(1, 6):
+            recapture = cache.hash(self._page(lines, seed=seed))
+            distance = (recapture ^ frame_hash).bit_count()
+            self.assertGreater(distance, 0)
+            self.assertLessEqual(distance, cache.max_distance)
+            self.assertEqual(cache.get(recapture), 'page one')
+
+    def test_different_page_misses(self):
+        """Test that a different page under the same lighting misses"""
+        cache = PerceptualHashCache(capacity=2)
+        page_one = cache.hash(self._page(["EXIT ONLY", "Platform 4", "Trains to", "Central"], seed=0))
+        page_two = cache.hash(self._page(["NO ENTRY", "Staff only", "Fire door", "Keep shut"], seed=1))
+        cache.put(page_one, 'page one')
+
+        self.assertGreater((page_one ^ page_two).bit_count(), cache.max_distance)
+        self.assertIsNone(cache.get(page_two))
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted"""
+        cache = PerceptualHashCache(capacity=2, max_distance=0)
+        cache.put(1, 'a')
+        cache.put(2, 'b')
+        cache.get(1)
+        cache.put(4, 'c')
+
+        self.assertEqual(cache.get(1), 'a')
+        self.assertIsNone(cache.get(2))
+        self.assertEqual(cache.get(4), 'c')
+
+
+class TestSharedFrameRing(unittest.TestCase):
+    """Test shared memory frame ring"""
+
+    # Runs in a separate interpreter: attach, check the frame, exit
+    READER_SCRIPT = """
+import sys
+import numpy as np
+sys.path.insert(0, sys.argv[1])
+from utils import SharedFrameRing
+
+reader = SharedFrameRing((4, 6, 3), num_slots=2, name=sys.argv[2])
+view = reader.read(int(sys.argv[3]), int(sys.argv[4]))
+expected = np.arange(72, dtype=np.uint8).reshape(4, 6, 3)
+ok = view is not None and not view.flags.writeable and np.array_equal(view, expected)
+del view
+reader.close()
+sys.exit(0 if ok else 1)
+"""
+
+    @unittest.skipUnless(os.path.isdir('/dev/shm'), "POSIX shared memory only")
+    def test_reader_process_exit_keeps_segment(self):
+        """Test a reader in another process sees frames and does not unlink the ring on exit"""
+        ring = SharedFrameRing((4, 6, 3), num_slots=2)
+        try:
+            frame = np.arange(72, dtype=np.uint8).reshape(4, 6, 3)
+            sequence, slot = ring.write(frame)
+
+            reader = subprocess.run(
+                [sys.executable, '-c', self.READER_SCRIPT,
+                 str(Path(__file__).parent.parent / 'src'), ring.name, str(slot), str(sequence)],
+                capture_output=True, text=True, timeout=60
+            )
+            self.assertEqual(reader.returncode, 0, reader.stderr)
+
+            # The reader's resource tracker must not have unlinked the block
+            self.assertTrue(os.path.exists(f"/dev/shm/{ring.name}"))
+
+            # Two more writes wrap around and overwrite the slot
+            ring.write(frame)
+            ring.write(frame)
+            self.assertFalse(ring.is_current(slot, sequence))
+            self.assertIsNone(ring.read(slot, sequence))
+        finally:
+            ring.close()
+
+
 class TestPaths(unittest.TestCase):
     """Test path configurations"""
 